@@ -2,7 +2,13 @@ from contextlib import suppress
 
 import pytest
 
-from .containers.common import DockerContainer, EphemeralDockerImage, WebContainer
+from .containers.common import (
+    DockerContainer,
+    DockerContainerGroup,
+    EphemeralDockerImage,
+    SharedDockerContainer,
+    WebContainer,
+)
 from .containers.dynamodb_admin import DynamoDBAdminContainer
 from .containers.localstack import LocalStackContainer
 from .containers.minio import MinioContainer
@@ -25,6 +31,7 @@ with suppress(ImportError):  # 'sftp' extra dependency
 __all__ = [
     "DatabaseContainer",
     "DockerContainer",
+    "DockerContainerGroup",
     "DynamoDBAdminContainer",
     "EphemeralDockerImage",
     "LocalStackContainer",
@@ -33,6 +40,7 @@ __all__ = [
     "MySQLContainer",
     "PostgreSQLContainer",
     "SFTPContainer",
+    "SharedDockerContainer",
     "TomodachiContainer",
     "WebContainer",
     "WireMockContainer",
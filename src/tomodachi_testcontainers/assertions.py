@@ -1,5 +1,4 @@
 from datetime import UTC, datetime, timedelta
-from typing import cast
 
 from . import DockerContainer
 
@@ -13,29 +12,32 @@ def assert_datetime_within_range(value: datetime, range: timedelta = DEFAULT_DAT
     assert start_datetime <= value <= end_datetime  # nosec: B101
 
 
-def assert_logs_contain(container: DockerContainer, contains: str) -> None:
-    stdout_and_stderr_logs = cast("tuple[bytes, bytes]", container.get_logs())
-    for log in stdout_and_stderr_logs:
-        if contains in log.decode():
-            return
-    raise AssertionError(f"Expected logs to contain: '{contains}'; logs: {stdout_and_stderr_logs}")
+def assert_logs_contain(container: DockerContainer, contains: str, since: int = 0) -> None:
+    """Asserts that the container logs contain the given string.
 
+    All log lines kept in the container's log buffer, up to the most recent 1 MiB, are checked by default.
+    Use `since=container.get_log_cursor().position()` to check only the logs emitted after the given position,
+    e.g., since the test has started.
+    """
+    logs = "\n".join(container.get_log_cursor().lines(since=since))
+    if contains not in logs:
+        raise AssertionError(f"Expected logs to contain: '{contains}'; logs: {logs}")
 
-def assert_logs_not_contain(container: DockerContainer, contains: str) -> None:
-    stdout_and_stderr_logs = cast("tuple[bytes, bytes]", container.get_logs())
-    for log in stdout_and_stderr_logs:
-        if contains in log.decode():
-            raise AssertionError(f"Expected logs not to contain: '{contains}'; logs: {stdout_and_stderr_logs}")
 
+def assert_logs_not_contain(container: DockerContainer, contains: str, since: int = 0) -> None:
+    """Asserts that the container logs don't contain the given string."""
+    logs = "\n".join(container.get_log_cursor().lines(since=since))
+    if contains in logs:
+        raise AssertionError(f"Expected logs not to contain: '{contains}'; logs: {logs}")
 
-def assert_logs_match_line_count(container: DockerContainer, contains: str, count: int) -> None:
-    stdout_logs = cast("bytes", container.get_logs()[0])
-    stderr_logs = cast("bytes", container.get_logs()[1])
-    stdout_and_stderr_logs = f"{stdout_logs.decode()}\n{stderr_logs.decode()}"
 
-    matched_lines = [log for log in stdout_and_stderr_logs.splitlines() if contains in log]
+def assert_logs_match_line_count(container: DockerContainer, contains: str, count: int, since: int = 0) -> None:
+    """Asserts that the given string is contained in exactly `count` log lines."""
+    log_lines = container.get_log_cursor().lines(since=since)
+    logs = "\n".join(log_lines)
+
+    matched_lines = [log for log in log_lines if contains in log]
     error_msg = (
-        f"Expected '{contains}' to be contained in {count} lines, found {len(matched_lines)} lines"
-        f"; logs: {stdout_and_stderr_logs}"
+        f"Expected '{contains}' to be contained in {count} lines, found {len(matched_lines)} lines; logs: {logs}"
     )
     assert len(matched_lines) == count, error_msg  # nosec: B101
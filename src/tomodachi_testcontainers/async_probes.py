@@ -4,22 +4,49 @@ Inspired by [Awaitility](https://github.com/awaitility/awaitility) and [busypie]
 """
 
 import asyncio
+import contextvars
+import functools
+import inspect
+import random
+import time
 from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
 from contextlib import suppress
-from typing import Any, TypeVar, cast, overload
+from dataclasses import dataclass
+from typing import Any, Literal, TypeVar, cast, overload
 
-from tenacity import AsyncRetrying, RetryError, retry_unless_exception_type
+from tenacity import AsyncRetrying, RetryCallState, RetryError, retry_unless_exception_type
 from tenacity.stop import stop_after_delay
-from tenacity.wait import wait_fixed
+from tenacity.wait import wait_base, wait_fixed
 
 T = TypeVar("T")
 
+Backoff = Literal["fixed", "exponential", "fibonacci"]
+
+_MAX_BACKOFF_ATTEMPT = 32  # Keeps the backoff multiplier from overflowing on long-running probes
+
+
+@dataclass
+class ProbeStats:
+    """Probe timing statistics, filled in when probing finishes."""
+
+    attempts: int = 0
+    """Number of times the probe was invoked."""
+    elapsed: float = 0.0
+    """Seconds from the first attempt until the probing finished, e.g., time to success for `probe_until`."""
+
 
 @overload
 async def probe_until(
     probe: Callable[[], Awaitable[T]],
     probe_interval: float = 0.1,
     stop_after: float = 3.0,
+    *,
+    backoff: Backoff = "fixed",
+    max_probe_interval: float = 1.0,
+    wake_on: asyncio.Event | None = None,
+    stats: ProbeStats | None = None,
+    executor: Executor | None = None,
 ) -> T: ...  # pragma: no cover
 
 
@@ -28,6 +55,12 @@ async def probe_until(
     probe: Callable[[], T],
     probe_interval: float = 0.1,
     stop_after: float = 3.0,
+    *,
+    backoff: Backoff = "fixed",
+    max_probe_interval: float = 1.0,
+    wake_on: asyncio.Event | None = None,
+    stats: ProbeStats | None = None,
+    executor: Executor | None = None,
 ) -> T: ...  # pragma: no cover
 
 
@@ -35,21 +68,40 @@ async def probe_until(
     probe: Callable[[], Awaitable[T]] | Callable[[], T],
     probe_interval: float = 0.1,
     stop_after: float = 3.0,
+    *,
+    backoff: Backoff = "fixed",
+    max_probe_interval: float = 1.0,
+    wake_on: asyncio.Event | None = None,
+    stats: ProbeStats | None = None,
+    executor: Executor | None = None,
 ) -> T:
     """Run given function until it finishes without exceptions.
 
     Given function can be a regular synchronous function or an asynchronous function.
+    Synchronous functions, e.g., assertions on container logs that make blocking Docker API calls,
+    run in the `executor`, or in the event loop's default thread pool executor, so they don't block the event loop.
+
+    By default, the probe runs every `probe_interval` seconds. With `exponential` or `fibonacci` backoff,
+    the interval starts at `probe_interval` and grows up to a jittered `max_probe_interval` cap,
+    so cheap probes finish quickly, and expensive probes don't run too often.
+    When `wake_on` event is set, e.g., by a log line or a message arrival callback,
+    the next attempt starts immediately instead of waiting for the interval to pass.
+    Pass a `ProbeStats` object as `stats` to collect the number of attempts and the time to success.
     """
     result: Any = None
-    async for attempt in AsyncRetrying(
-        wait=wait_fixed(probe_interval),
+    started_at = time.monotonic()
+    retrying = AsyncRetrying(
+        wait=_get_wait_strategy(backoff, probe_interval, max_probe_interval),
         stop=stop_after_delay(stop_after),
+        sleep=_get_sleep(wake_on),
         reraise=True,
-    ):
-        with attempt:
-            result = probe()
-            if asyncio.iscoroutine(result):
-                result = await result
+    )
+    try:
+        async for attempt in retrying:
+            with attempt:
+                result = await _call_probe(probe, executor)
+    finally:
+        _fill_stats(stats, retrying, started_at)
     return cast("T", result)
 
 
@@ -58,6 +110,12 @@ async def probe_during_interval(
     probe: Callable[[], Awaitable[T]],
     probe_interval: float = 0.1,
     stop_after: float = 3.0,
+    *,
+    backoff: Backoff = "fixed",
+    max_probe_interval: float = 1.0,
+    wake_on: asyncio.Event | None = None,
+    stats: ProbeStats | None = None,
+    executor: Executor | None = None,
 ) -> T: ...  # pragma: no cover
 
 
@@ -66,6 +124,12 @@ async def probe_during_interval(
     probe: Callable[[], T],
     probe_interval: float = 0.1,
     stop_after: float = 3.0,
+    *,
+    backoff: Backoff = "fixed",
+    max_probe_interval: float = 1.0,
+    wake_on: asyncio.Event | None = None,
+    stats: ProbeStats | None = None,
+    executor: Executor | None = None,
 ) -> T: ...  # pragma: no cover
 
 
@@ -73,21 +137,208 @@ async def probe_during_interval(
     probe: Callable[[], Awaitable[T] | T],
     probe_interval: float = 0.1,
     stop_after: float = 3.0,
+    *,
+    backoff: Backoff = "fixed",
+    max_probe_interval: float = 1.0,
+    wake_on: asyncio.Event | None = None,
+    stats: ProbeStats | None = None,
+    executor: Executor | None = None,
 ) -> T:
     """Run given function until timeout is reached and the function always finishes without exceptions.
 
     Given function can be a regular synchronous function or an asynchronous function.
+
+    `backoff`, `max_probe_interval`, `wake_on`, `stats` and `executor` work the same way as in `probe_until`.
     """
     result: Any = None
-    with suppress(RetryError):
-        async for attempt in AsyncRetrying(
-            wait=wait_fixed(probe_interval),
-            stop=stop_after_delay(stop_after),
-            retry=retry_unless_exception_type(BaseException),
-            reraise=True,
-        ):
-            with attempt:
-                result = probe()
-                if asyncio.iscoroutine(result):
-                    result = await result
+    started_at = time.monotonic()
+    retrying = AsyncRetrying(
+        wait=_get_wait_strategy(backoff, probe_interval, max_probe_interval),
+        stop=stop_after_delay(stop_after),
+        sleep=_get_sleep(wake_on),
+        retry=retry_unless_exception_type(BaseException),
+        reraise=True,
+    )
+    try:
+        with suppress(RetryError):
+            async for attempt in retrying:
+                with attempt:
+                    result = await _call_probe(probe, executor)
+    finally:
+        _fill_stats(stats, retrying, started_at)
     return cast("T", result)
+
+
+class ProbeTimeoutError(TimeoutError):
+    """Raised when probes don't succeed within the deadline; contains the last error of every failed probe."""
+
+    def __init__(self, stop_after: float, errors: dict[str, BaseException | None]) -> None:
+        failed_probes = "\n".join(f"- {name}: {error!r}" for name, error in errors.items())
+        super().__init__(f"{len(errors)} probe(s) did not succeed within {stop_after} seconds:\n{failed_probes}")
+        self.errors = errors
+
+
+async def probe_all(
+    *probes: Callable[[], Awaitable[Any]] | Callable[[], Any],
+    probe_interval: float = 0.1,
+    stop_after: float = 3.0,
+    rate_limit: float | None = None,
+    executor: Executor | None = None,
+) -> list[Any]:
+    """Run given functions concurrently until all of them finish without exceptions, and return their results.
+
+    All probes share one `stop_after` deadline, and optionally one `rate_limit` - the maximum number of attempts
+    per second across all probes. Synchronous functions run in the `executor`, or in the event loop's default
+    thread pool executor, so they don't block the event loop.
+    When the deadline is reached, raises `ProbeTimeoutError` with the last error of every probe that didn't succeed.
+    """
+    return await _run_probes(
+        probes, probe_interval, stop_after, rate_limit, executor, return_when=asyncio.ALL_COMPLETED
+    )
+
+
+async def probe_any(
+    *probes: Callable[[], Awaitable[Any]] | Callable[[], Any],
+    probe_interval: float = 0.1,
+    stop_after: float = 3.0,
+    rate_limit: float | None = None,
+    executor: Executor | None = None,
+) -> Any:
+    """Run given functions concurrently until any of them finishes without exceptions, and return its result.
+
+    The other probes are cancelled as soon as one of the probes succeeds.
+    `stop_after`, `rate_limit` and the handling of synchronous functions work the same way as in `probe_all`.
+    """
+    [result] = await _run_probes(
+        probes, probe_interval, stop_after, rate_limit, executor, return_when=asyncio.FIRST_COMPLETED
+    )
+    return result
+
+
+async def _run_probes(
+    probes: tuple[Callable[[], Any], ...],
+    probe_interval: float,
+    stop_after: float,
+    rate_limit: float | None,
+    executor: Executor | None,
+    return_when: str,
+) -> list[Any]:
+    if not probes:
+        raise ValueError("At least one probe is required")
+    rate_limiter = _RateLimiter(rate_limit)
+    last_errors: dict[int, BaseException | None] = dict.fromkeys(range(len(probes)))
+
+    async def _probe(index: int, probe: Callable[[], Any]) -> Any:
+        while True:
+            await rate_limiter.acquire()
+            try:
+                return await _call_probe(probe, executor)
+            except Exception as e:
+                last_errors[index] = e
+            await asyncio.sleep(probe_interval)
+
+    tasks = [asyncio.create_task(_probe(i, probe)) for i, probe in enumerate(probes)]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=stop_after, return_when=return_when)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if return_when == asyncio.FIRST_COMPLETED and done:
+        return [next(task for task in tasks if task in done).result()]
+    if return_when == asyncio.ALL_COMPLETED and len(done) == len(tasks):
+        return [task.result() for task in tasks]
+    raise ProbeTimeoutError(
+        stop_after,
+        {
+            _get_probe_name(i, probe): last_errors[i]
+            for i, (probe, task) in enumerate(zip(probes, tasks, strict=True))
+            if task not in done
+        },
+    )
+
+
+async def _call_probe(probe: Callable[[], Any], executor: Executor | None = None) -> Any:
+    if inspect.iscoroutinefunction(probe):
+        result = probe()
+    else:
+        # Context is copied like in asyncio.to_thread, so that the probe sees the caller's context variables
+        result = await asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(contextvars.copy_context().run, probe)
+        )
+    # Sync callables like lambdas can return awaitables, e.g., coroutines or futures - await them on the event loop
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def _get_probe_name(index: int, probe: Callable[[], Any]) -> str:
+    return f"#{index} {getattr(probe, '__name__', repr(probe))}"
+
+
+class _RateLimiter:
+    """Spaces out probe attempts to at most `rate_limit` attempts per second."""
+
+    def __init__(self, rate_limit: float | None) -> None:
+        self._min_interval = 1 / rate_limit if rate_limit else 0.0
+        self._next_attempt_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self._min_interval:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            if (delay := self._next_attempt_at - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            self._next_attempt_at = loop.time() + self._min_interval
+
+
+class _BackoffWait(wait_base):
+    """Grows the wait interval by the given multipliers sequence up to a jittered cap."""
+
+    def __init__(self, initial: float, cap: float, multiplier: Callable[[int], float]) -> None:
+        self._initial = initial
+        self._cap = cap
+        self._multiplier = multiplier
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        interval = self._initial * self._multiplier(min(retry_state.attempt_number, _MAX_BACKOFF_ATTEMPT))
+        if interval >= self._cap:
+            # Jitter spreads out probes that reached the cap at the same time
+            return random.uniform(self._cap / 2, self._cap)
+        return interval
+
+
+def _get_wait_strategy(backoff: Backoff, probe_interval: float, max_probe_interval: float) -> wait_base:
+    if backoff == "exponential":
+        return _BackoffWait(probe_interval, max_probe_interval, lambda attempt: 2 ** (attempt - 1))
+    if backoff == "fibonacci":
+        return _BackoffWait(probe_interval, max_probe_interval, _fibonacci)
+    return wait_fixed(probe_interval)
+
+
+def _fibonacci(n: int) -> int:
+    a, b = 1, 1
+    for _ in range(n - 1):
+        a, b = b, a + b
+    return a
+
+
+def _get_sleep(wake_on: asyncio.Event | None) -> Callable[[float], Awaitable[None]]:
+    async def _sleep(seconds: float) -> None:
+        if wake_on is None:
+            await asyncio.sleep(seconds)
+            return
+        with suppress(TimeoutError):
+            await asyncio.wait_for(wake_on.wait(), timeout=seconds)
+        wake_on.clear()
+
+    return _sleep
+
+
+def _fill_stats(stats: ProbeStats | None, retrying: AsyncRetrying, started_at: float) -> None:
+    if stats is not None:
+        stats.attempts = retrying.statistics.get("attempt_number", 0)
+        stats.elapsed = time.monotonic() - started_at
@@ -1,7 +1,12 @@
+import asyncio
 import inspect
 import json
-from contextlib import suppress
+import threading
+import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator, Iterable, Mapping, Sequence
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any, Generic, Protocol, TypeVar, Union
 
 from botocore.exceptions import ClientError
@@ -14,6 +19,8 @@ from types_aiobotocore_sqs.type_defs import MessageAttributeValueTypeDef as SQSM
 from types_aiobotocore_sqs.type_defs import MessageTypeDef as SQSMessageTypeDef
 
 __all__ = [
+    "BatchEntriesFailedError",
+    "FailedBatchEntry",
     "QueueDoesNotExistError",
     "SNSSQSTestClient",
     "SQSMessage",
@@ -21,10 +28,16 @@ __all__ = [
 ]
 
 MessageType = TypeVar("MessageType")
+ReturnType = TypeVar("ReturnType")
 
 TopicARNType = str
 QueueARNType = str
 
+_MAX_BATCH_SIZE = 10  # SNS PublishBatch and SQS SendMessageBatch limit
+
+_QUEUE_DOES_NOT_EXIST_ERROR_CODES = frozenset({"AWS.SimpleQueueService.NonExistentQueue", "QueueDoesNotExist"})
+_TOPIC_DOES_NOT_EXIST_ERROR_CODES = frozenset({"NotFound"})
+
 
 @dataclass
 class SQSMessage(Generic[MessageType]):
@@ -32,6 +45,25 @@ class SQSMessage(Generic[MessageType]):
     message_attributes: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class FailedBatchEntry:
+    index: int
+    """Position of the failed message in the published or sent messages."""
+    code: str
+    message: str
+    sender_fault: bool
+
+
+class BatchEntriesFailedError(Exception):
+    def __init__(self, failed_entries: list[FailedBatchEntry]) -> None:
+        super().__init__(
+            f"{len(failed_entries)} batch entries failed; first failed entry: {failed_entries[0]}"
+            if failed_entries
+            else "Batch entries failed"
+        )
+        self.failed_entries = failed_entries
+
+
 class TopicDoesNotExistError(Exception):
     pass  # pragma: no cover
 
@@ -66,13 +98,30 @@ TomodachiSNSSQSEnvelope = Union[_TomodachiSNSSQSEnvelopeStatic, _TomodachiSNSSQS
 
 
 class SNSSQSTestClient:
-    """Provides common methods for testing AWS SNS/SQS interactions with Tomodachi framework."""
+    """Provides common methods for testing AWS SNS/SQS interactions with Tomodachi framework.
 
-    def __init__(self, sns_client: SNSClient, sqs_client: SQSClient) -> None:
+    Topic ARNs and queue URLs are cached, so that publishing or sending many messages doesn't look them up every time.
+    The cache is updated when topics and queues are created or deleted with the client,
+    and a cached entry is invalidated when AWS responds that the topic or queue doesn't exist,
+    e.g., after the AWS mock container is reset.
+
+    Received messages are decoded with a decoder resolved once per envelope and message type.
+    With `decode_protobuf_in_thread_pool=True`, batches of protobuf messages are decoded in a worker thread,
+    so that decoding large numbers of messages doesn't block the event loop.
+    """
+
+    def __init__(
+        self, sns_client: SNSClient, sqs_client: SQSClient, decode_protobuf_in_thread_pool: bool = False
+    ) -> None:
         self._sns_client = sns_client
         self._sqs_client = sqs_client
+        self._decode_protobuf_in_thread_pool = decode_protobuf_in_thread_pool
+        self._topic_arns: dict[str, TopicARNType] = {}
+        self._queue_urls: dict[str, str] = {}
+        self._message_decoders: dict[tuple[Any, Any], _MessageDecoder[Any]] = {}
 
     async def create_topic(self, topic: str) -> TopicARNType:
+        self._topic_arns.pop(topic, None)
         with suppress(TopicDoesNotExistError):
             return await self.get_topic_arn(topic)
         topic_attributes: dict[str, str] = {}
@@ -82,9 +131,11 @@ class SNSSQSTestClient:
                 "ContentBasedDeduplication": "false",
             })
         create_topic_response = await self._sns_client.create_topic(Name=topic, Attributes=topic_attributes)
+        self._topic_arns[topic] = create_topic_response["TopicArn"]
         return create_topic_response["TopicArn"]
 
     async def create_queue(self, queue: str) -> QueueARNType:
+        self._queue_urls.pop(queue, None)
         with suppress(QueueDoesNotExistError):
             return await self.get_queue_arn(queue)
         queue_attributes: dict[QueueAttributeNameType, str] = {}
@@ -93,10 +144,22 @@ class SNSSQSTestClient:
                 "FifoQueue": "true",
                 "ContentBasedDeduplication": "false",
             })
-        await self._sqs_client.create_queue(QueueName=queue, Attributes=queue_attributes)
+        create_queue_response = await self._sqs_client.create_queue(QueueName=queue, Attributes=queue_attributes)
+        self._queue_urls[queue] = create_queue_response["QueueUrl"]
         queue_attributes = await self.get_queue_attributes(queue, attributes=["QueueArn"])
         return queue_attributes["QueueArn"]
 
+    async def delete_topic(self, topic: str) -> None:
+        topic_arn = await self.get_topic_arn(topic)
+        self._topic_arns.pop(topic, None)
+        await self._sns_client.delete_topic(TopicArn=topic_arn)
+
+    async def delete_queue(self, queue: str) -> None:
+        queue_url = await self.get_queue_url(queue)
+        self._queue_urls.pop(queue, None)
+        with self._raise_queue_does_not_exist_error(queue):
+            await self._sqs_client.delete_queue(QueueUrl=queue_url)
+
     async def subscribe_to(
         self,
         topic: str,
@@ -119,20 +182,143 @@ class SNSSQSTestClient:
         envelope: TomodachiSNSSQSEnvelope,
         message_type: type[MessageType],
         max_messages: int = 10,
+        wait_time_seconds: int = 0,
     ) -> list[SQSMessage[MessageType]]:
-        """Receive messages from SQS queue."""
+        """Receive messages from SQS queue.
+
+        With `wait_time_seconds` greater than zero, long polling waits for messages to arrive
+        instead of returning an empty response immediately.
+        Received messages are parsed concurrently and deleted from the queue with a single DeleteMessageBatch call.
+        """
         queue_url = await self.get_queue_url(queue)
-        received_messages_response = await self._sqs_client.receive_message(
-            QueueUrl=queue_url, MaxNumberOfMessages=max_messages, MessageAttributeNames=["All"]
-        )
+        received_messages = await self._receive_messages(queue, queue_url, max_messages, wait_time_seconds)
+        if not received_messages:
+            return []
+        sqs_messages = await self._get_message_decoder(envelope, message_type).decode_batch(received_messages)
+        await self._delete_messages(queue, queue_url, [v["ReceiptHandle"] for v in received_messages])
+        return sqs_messages
+
+    async def receive_until(
+        self,
+        queue: str,
+        envelope: TomodachiSNSSQSEnvelope,
+        message_type: type[MessageType],
+        count: int,
+        stop_after: float = 10.0,
+        receivers: int = 3,
+        wait_time_seconds: int = 1,
+    ) -> list[SQSMessage[MessageType]]:
+        """Receive messages from SQS queue until at least `count` messages are received.
+
+        The queue is drained by `receivers` concurrent long-polling receivers.
+        Receivers finish their in-flight receive calls instead of being cancelled, so no received message is lost,
+        and more than `count` messages can be returned.
+        Raises `TimeoutError` if fewer than `count` messages are received within `stop_after` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + stop_after
         sqs_messages: list[SQSMessage[MessageType]] = []
-        for received_message in received_messages_response.get("Messages", []):
-            payload = await self._parse_received_message_payload(envelope, message_type, received_message)
-            message_attributes = self._parse_received_message_attributes(received_message)
-            sqs_messages.append(SQSMessage(payload, message_attributes))
-            await self._sqs_client.delete_message(QueueUrl=queue_url, ReceiptHandle=received_message["ReceiptHandle"])
+
+        async def _receive() -> None:
+            while len(sqs_messages) < count and (remaining := deadline - loop.time()) > 0:
+                sqs_messages.extend(
+                    await self.receive(
+                        queue, envelope, message_type, wait_time_seconds=min(wait_time_seconds, int(remaining))
+                    )
+                )
+
+        await asyncio.gather(*(_receive() for _ in range(receivers)))
+        if len(sqs_messages) < count:
+            raise TimeoutError(
+                f"Received {len(sqs_messages)} of {count} messages from '{queue}' within {stop_after} seconds"
+            )
         return sqs_messages
 
+    async def stream(
+        self,
+        queue: str,
+        envelope: TomodachiSNSSQSEnvelope,
+        message_type: type[MessageType],
+        receivers: int = 3,
+        buffer_size: int = 100,
+        wait_time_seconds: int = 20,
+        stop_after_idle: float | None = None,
+        visibility_timeout: int = 30,
+    ) -> AsyncGenerator[SQSMessage[MessageType], None]:
+        """Iterate over messages from SQS queue as they arrive.
+
+        Messages are received by `receivers` concurrent long-polling receivers into a buffer of `buffer_size` messages;
+        when the buffer is full, the receivers wait until the messages are consumed.
+        Consumed messages are deleted from the queue in batches of 10 messages.
+        Received messages are hidden from other consumers for `visibility_timeout` seconds,
+        and the visibility timeout is extended every `visibility_timeout / 2` seconds until the messages are deleted,
+        so that a slow consumer doesn't receive the same messages again.
+        Messages that are buffered but not consumed aren't deleted
+        and become visible in the queue again after `visibility_timeout` seconds.
+
+        The iteration stops when no messages arrive for `stop_after_idle` seconds, or never if it's `None`.
+        Close the iterator when stopping the iteration early, e.g., with `contextlib.aclosing`,
+        so that the consumed messages are deleted and the receivers are stopped immediately.
+        """
+        queue_url = await self.get_queue_url(queue)
+        decoder = self._get_message_decoder(envelope, message_type)
+        buffer: asyncio.Queue[tuple[SQSMessage[MessageType], str] | Exception] = asyncio.Queue(maxsize=buffer_size)
+        in_flight_receipt_handles: set[str] = set()
+
+        async def _receive() -> None:
+            try:
+                while True:
+                    received_messages = await self._receive_messages(
+                        queue, queue_url, 10, wait_time_seconds, visibility_timeout=visibility_timeout
+                    )
+                    in_flight_receipt_handles.update(v["ReceiptHandle"] for v in received_messages)
+                    sqs_messages = await decoder.decode_batch(received_messages)
+                    for sqs_message, received_message in zip(sqs_messages, received_messages, strict=True):
+                        await buffer.put((sqs_message, received_message["ReceiptHandle"]))
+            except Exception as e:  # Raised in the consumer
+                await buffer.put(e)
+
+        async def _extend_visibility() -> None:
+            while True:
+                await asyncio.sleep(visibility_timeout / 2)
+                receipt_handles = list(in_flight_receipt_handles)
+                for i in range(0, len(receipt_handles), _MAX_BATCH_SIZE):
+                    batch = receipt_handles[i : i + _MAX_BATCH_SIZE]
+                    failed_entries = await self._change_messages_visibility(queue, queue_url, batch, visibility_timeout)
+                    # Messages deleted by the consumer during the request can't be changed anymore
+                    if failed_entries := [v for v in failed_entries if batch[v.index] in in_flight_receipt_handles]:
+                        raise BatchEntriesFailedError(failed_entries)
+
+        async def _delete_consumed_messages(receipt_handles: list[str]) -> None:
+            await self._delete_messages(queue, queue_url, receipt_handles)
+            in_flight_receipt_handles.difference_update(receipt_handles)
+
+        receiver_tasks = [asyncio.create_task(_receive()) for _ in range(receivers)]
+        visibility_task = asyncio.create_task(_extend_visibility())
+        consumed_receipt_handles: list[str] = []
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(buffer.get(), timeout=stop_after_idle)
+                except TimeoutError:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                if visibility_task.done():
+                    visibility_task.result()  # Raise the visibility timeout extension error in the consumer
+                sqs_message, receipt_handle = item
+                consumed_receipt_handles.append(receipt_handle)
+                yield sqs_message
+                if len(consumed_receipt_handles) == _MAX_BATCH_SIZE:
+                    await _delete_consumed_messages(consumed_receipt_handles)
+                    consumed_receipt_handles = []
+        finally:
+            for task in [*receiver_tasks, visibility_task]:
+                task.cancel()
+            await asyncio.gather(*receiver_tasks, visibility_task, return_exceptions=True)
+            if consumed_receipt_handles:
+                await _delete_consumed_messages(consumed_receipt_handles)
+
     async def publish(
         self,
         topic: str,
@@ -152,7 +338,43 @@ class SNSSQSTestClient:
             sns_publish_kwargs["MessageDeduplicationId"] = message_deduplication_id
         if message_group_id:
             sns_publish_kwargs["MessageGroupId"] = message_group_id
-        await self._sns_client.publish(TopicArn=topic_arn, Message=message, **sns_publish_kwargs)
+        with self._raise_topic_does_not_exist_error(topic):
+            await self._sns_client.publish(TopicArn=topic_arn, Message=message, **sns_publish_kwargs)
+
+    async def publish_batch(
+        self,
+        topic: str,
+        data: Iterable[Any],
+        envelope: TomodachiSNSSQSEnvelope,
+        message_attributes: dict[str, SNSMessageAttributeValueTypeDef] | None = None,
+        message_group_id: str | None = None,
+        max_concurrency: int = 10,
+    ) -> None:
+        """Publish messages to SNS topic with PublishBatch API in batches of 10 messages.
+
+        Up to `max_concurrency` batches are published concurrently.
+        Messages published to a FIFO topic get unique deduplication IDs.
+        Raises `BatchEntriesFailedError` with the failed entries if some messages weren't published.
+        """
+        topic_arn = await self.get_topic_arn(topic)
+
+        async def _publish_batch(offset: int, batch: list[Any]) -> Sequence[Mapping[str, Any]]:
+            messages = await asyncio.gather(*(envelope.build_message(service={}, topic=topic, data=v) for v in batch))
+            entries: list[Any] = []
+            for i, message in enumerate(messages, start=offset):
+                entry: dict[str, Any] = {"Id": str(i), "Message": message}
+                if message_attributes:
+                    entry["MessageAttributes"] = message_attributes
+                if topic.endswith(".fifo"):
+                    entry["MessageDeduplicationId"] = uuid.uuid4().hex
+                if message_group_id:
+                    entry["MessageGroupId"] = message_group_id
+                entries.append(entry)
+            with self._raise_topic_does_not_exist_error(topic):
+                response = await self._sns_client.publish_batch(TopicArn=topic_arn, PublishBatchRequestEntries=entries)
+            return response.get("Failed", [])
+
+        await self._run_batches(data, _publish_batch, max_concurrency)
 
     async def send(
         self,
@@ -173,20 +395,61 @@ class SNSSQSTestClient:
             sqs_send_kwargs["MessageDeduplicationId"] = message_deduplication_id
         if message_group_id:
             sqs_send_kwargs["MessageGroupId"] = message_group_id
-        await self._sqs_client.send_message(
-            QueueUrl=queue_url, MessageBody=json.dumps({"Message": message}), **sqs_send_kwargs
-        )
+        with self._raise_queue_does_not_exist_error(queue):
+            await self._sqs_client.send_message(
+                QueueUrl=queue_url, MessageBody=json.dumps({"Message": message}), **sqs_send_kwargs
+            )
+
+    async def send_batch(
+        self,
+        queue: str,
+        data: Iterable[Any],
+        envelope: TomodachiSNSSQSEnvelope,
+        message_attributes: dict[str, SQSMessageAttributeValueTypeDef] | None = None,
+        message_group_id: str | None = None,
+        max_concurrency: int = 10,
+    ) -> None:
+        """Send messages to SQS queue with SendMessageBatch API in batches of 10 messages.
+
+        Up to `max_concurrency` batches are sent concurrently.
+        Messages sent to a FIFO queue get unique deduplication IDs.
+        Raises `BatchEntriesFailedError` with the failed entries if some messages weren't sent.
+        """
+        queue_url = await self.get_queue_url(queue)
+
+        async def _send_batch(offset: int, batch: list[Any]) -> Sequence[Mapping[str, Any]]:
+            messages = await asyncio.gather(*(envelope.build_message(service={}, topic="", data=v) for v in batch))
+            entries: list[Any] = []
+            for i, message in enumerate(messages, start=offset):
+                entry: dict[str, Any] = {"Id": str(i), "MessageBody": json.dumps({"Message": message})}
+                if message_attributes:
+                    entry["MessageAttributes"] = message_attributes
+                if queue.endswith(".fifo"):
+                    entry["MessageDeduplicationId"] = uuid.uuid4().hex
+                if message_group_id:
+                    entry["MessageGroupId"] = message_group_id
+                entries.append(entry)
+            with self._raise_queue_does_not_exist_error(queue):
+                response = await self._sqs_client.send_message_batch(QueueUrl=queue_url, Entries=entries)
+            return response.get("Failed", [])
+
+        await self._run_batches(data, _send_batch, max_concurrency)
 
     async def get_topic_arn(self, topic: str) -> str:
-        list_topics_response = await self._sns_client.list_topics()
-        topic_arn = next((v["TopicArn"] for v in list_topics_response["Topics"] if v["TopicArn"].endswith(topic)), None)
-        if not topic_arn:
-            raise TopicDoesNotExistError(topic)
-        return topic_arn
+        if topic_arn := self._topic_arns.get(topic):
+            return topic_arn
+        async for list_topics_response in self._sns_client.get_paginator("list_topics").paginate():
+            for v in list_topics_response["Topics"]:
+                # Topic ARN format: arn:aws:sns:<region>:<account-id>:<topic-name>
+                if v["TopicArn"].rsplit(":", 1)[-1] == topic:
+                    self._topic_arns[topic] = v["TopicArn"]
+                    return v["TopicArn"]
+        raise TopicDoesNotExistError(topic)
 
     async def get_topic_attributes(self, topic: str) -> dict[str, str]:
         topic_arn = await self.get_topic_arn(topic)
-        get_topic_attributes_response = await self._sns_client.get_topic_attributes(TopicArn=topic_arn)
+        with self._raise_topic_does_not_exist_error(topic):
+            get_topic_attributes_response = await self._sns_client.get_topic_attributes(TopicArn=topic_arn)
         return get_topic_attributes_response["Attributes"]
 
     async def get_queue_arn(self, queue: str) -> str:
@@ -194,42 +457,195 @@ class SNSSQSTestClient:
         return attributes["QueueArn"]
 
     async def get_queue_url(self, queue: str) -> str:
+        if queue_url := self._queue_urls.get(queue):
+            return queue_url
         try:
             get_queue_response = await self._sqs_client.get_queue_url(QueueName=queue)
-            return get_queue_response["QueueUrl"]
         except ClientError as e:
             raise QueueDoesNotExistError(queue) from e
+        self._queue_urls[queue] = get_queue_response["QueueUrl"]
+        return get_queue_response["QueueUrl"]
 
     async def get_queue_attributes(
         self, queue: str, attributes: list[QueueAttributeFilterType]
     ) -> dict[QueueAttributeNameType, str]:
         queue_url = await self.get_queue_url(queue)
-        get_queue_attributes_response = await self._sqs_client.get_queue_attributes(
-            QueueUrl=queue_url, AttributeNames=attributes
-        )
+        with self._raise_queue_does_not_exist_error(queue):
+            get_queue_attributes_response = await self._sqs_client.get_queue_attributes(
+                QueueUrl=queue_url, AttributeNames=attributes
+            )
         return get_queue_attributes_response["Attributes"]
 
     async def purge_queue(self, queue: str) -> None:
         """Delete all messages from SQS queue."""
         queue_url = await self.get_queue_url(queue)
-        await self._sqs_client.purge_queue(QueueUrl=queue_url)
+        with self._raise_queue_does_not_exist_error(queue):
+            await self._sqs_client.purge_queue(QueueUrl=queue_url)
+
+    async def _run_batches(
+        self,
+        data: Iterable[Any],
+        send_batch: Callable[[int, list[Any]], Awaitable[Sequence[Mapping[str, Any]]]],
+        max_concurrency: int,
+    ) -> None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _send_batch(offset: int, batch: list[Any]) -> Sequence[Mapping[str, Any]]:
+            async with semaphore:
+                return await send_batch(offset, batch)
+
+        tasks: list[asyncio.Task[Sequence[Mapping[str, Any]]]] = []
+        iterator, offset = iter(data), 0
+        while batch := list(islice(iterator, _MAX_BATCH_SIZE)):
+            tasks.append(asyncio.create_task(_send_batch(offset, batch)))
+            offset += len(batch)
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        failed_entries = _to_failed_batch_entries([v for result in results for v in result])
+        if failed_entries:
+            raise BatchEntriesFailedError(sorted(failed_entries, key=lambda v: v.index))
+
+    @contextmanager
+    def _raise_topic_does_not_exist_error(self, topic: str) -> Generator[None, None, None]:
+        try:
+            yield
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in _TOPIC_DOES_NOT_EXIST_ERROR_CODES:
+                raise
+            self._topic_arns.pop(topic, None)
+            raise TopicDoesNotExistError(topic) from e
+
+    @contextmanager
+    def _raise_queue_does_not_exist_error(self, queue: str) -> Generator[None, None, None]:
+        try:
+            yield
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in _QUEUE_DOES_NOT_EXIST_ERROR_CODES:
+                raise
+            self._queue_urls.pop(queue, None)
+            raise QueueDoesNotExistError(queue) from e
+
+    async def _receive_messages(
+        self,
+        queue: str,
+        queue_url: str,
+        max_messages: int,
+        wait_time_seconds: int,
+        visibility_timeout: int | None = None,
+    ) -> list[SQSMessageTypeDef]:
+        sqs_receive_kwargs: dict[str, Any] = {}
+        if visibility_timeout is not None:
+            sqs_receive_kwargs["VisibilityTimeout"] = visibility_timeout
+        with self._raise_queue_does_not_exist_error(queue):
+            received_messages_response = await self._sqs_client.receive_message(
+                QueueUrl=queue_url,
+                MaxNumberOfMessages=max_messages,
+                MessageAttributeNames=["All"],
+                WaitTimeSeconds=wait_time_seconds,
+                **sqs_receive_kwargs,
+            )
+        return received_messages_response.get("Messages", [])
+
+    async def _delete_messages(self, queue: str, queue_url: str, receipt_handles: list[str]) -> None:
+        entries: list[Any] = [{"Id": str(i), "ReceiptHandle": v} for i, v in enumerate(receipt_handles)]
+        with self._raise_queue_does_not_exist_error(queue):
+            response = await self._sqs_client.delete_message_batch(QueueUrl=queue_url, Entries=entries)
+        if failed := response.get("Failed"):
+            raise BatchEntriesFailedError(_to_failed_batch_entries(failed))
+
+    async def _change_messages_visibility(
+        self, queue: str, queue_url: str, receipt_handles: list[str], visibility_timeout: int
+    ) -> list[FailedBatchEntry]:
+        entries: list[Any] = [
+            {"Id": str(i), "ReceiptHandle": v, "VisibilityTimeout": visibility_timeout}
+            for i, v in enumerate(receipt_handles)
+        ]
+        with self._raise_queue_does_not_exist_error(queue):
+            response = await self._sqs_client.change_message_visibility_batch(QueueUrl=queue_url, Entries=entries)
+        return _to_failed_batch_entries(response.get("Failed", []))
+
+    def _get_message_decoder(
+        self, envelope: TomodachiSNSSQSEnvelope, message_type: type[MessageType]
+    ) -> "_MessageDecoder[MessageType]":
+        key = (envelope, message_type)
+        try:
+            return self._message_decoders[key]
+        except KeyError:
+            decoder = self._message_decoders[key] = _MessageDecoder(
+                envelope, message_type, decode_in_thread_pool=self._decode_protobuf_in_thread_pool
+            )
+            return decoder
+        except TypeError:  # Unhashable envelope instance
+            return _MessageDecoder(envelope, message_type, decode_in_thread_pool=self._decode_protobuf_in_thread_pool)
 
-    async def _parse_received_message_payload(
-        self, envelope: TomodachiSNSSQSEnvelope, message_type: type[MessageType], received_message: SQSMessageTypeDef
-    ) -> MessageType:
-        payload = json.loads(received_message["Body"])["Message"]
 
+class _MessageDecoder(Generic[MessageType]):
+    """Decodes received SQS messages with the given envelope to the given message type.
+
+    The message type is resolved once per decoder, and the message body JSON is parsed once per message.
+    """
+
+    def __init__(
+        self, envelope: TomodachiSNSSQSEnvelope, message_type: type[MessageType], decode_in_thread_pool: bool = False
+    ) -> None:
+        self._envelope = envelope
         is_proto_message = inspect.isclass(message_type) and issubclass(message_type, Message)
-        proto_class = message_type if is_proto_message else None
+        self._proto_class = message_type if is_proto_message else None
+        self._decode_in_thread_pool = decode_in_thread_pool and is_proto_message
+
+    async def decode_batch(self, received_messages: list[SQSMessageTypeDef]) -> list[SQSMessage[MessageType]]:
+        if self._decode_in_thread_pool and len(received_messages) > 1:
+            # Protobuf decoding is CPU-bound - decode on a long-lived event loop in a worker thread
+            return await _decoder_event_loop.run(self._decode_concurrently(received_messages))
+        return await self._decode_concurrently(received_messages)
+
+    async def decode(self, received_message: SQSMessageTypeDef) -> SQSMessage[MessageType]:
+        body = json.loads(received_message["Body"])
+        parsed_message, *_ = await self._envelope.parse_message(payload=body["Message"], proto_class=self._proto_class)
+        return SQSMessage(parsed_message["data"], self._decode_message_attributes(body, received_message))
 
-        parsed_message, *_ = await envelope.parse_message(payload=payload, proto_class=proto_class)
-        return parsed_message["data"]
+    async def _decode_concurrently(self, received_messages: list[SQSMessageTypeDef]) -> list[SQSMessage[MessageType]]:
+        return list(await asyncio.gather(*(self.decode(v) for v in received_messages)))
 
-    def _parse_received_message_attributes(self, received_message: SQSMessageTypeDef) -> dict[str, Any]:
+    def _decode_message_attributes(self, body: dict[str, Any], received_message: SQSMessageTypeDef) -> dict[str, Any]:
         # When received from SNS, the message attributes are added to the "Body" key by tomodachi framework
-        with suppress(KeyError, json.JSONDecodeError):
-            return json.loads(received_message["Body"])["MessageAttributes"]
+        if "MessageAttributes" in body:
+            return body["MessageAttributes"]
         # When received from SQS, the message attributes are in the "MessageAttributes" key
         if message_attributes := received_message.get("MessageAttributes"):
-            return message_attributes
+            return dict(message_attributes)
         return {}
+
+
+class _DecoderEventLoop:
+    """Runs coroutines on an event loop in a daemon worker thread, started on first use and reused afterwards."""
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    async def run(self, coro: Coroutine[Any, Any, ReturnType]) -> ReturnType:
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._get_loop()))
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="sqs-message-decoder", daemon=True).start()
+            return self._loop
+
+
+_decoder_event_loop = _DecoderEventLoop()
+
+
+def _to_failed_batch_entries(failed: Sequence[Mapping[str, Any]]) -> list[FailedBatchEntry]:
+    return [
+        FailedBatchEntry(
+            index=int(v["Id"]), code=v["Code"], message=v.get("Message", ""), sender_fault=v["SenderFault"]
+        )
+        for v in failed
+    ]
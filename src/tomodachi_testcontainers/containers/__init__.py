@@ -1,6 +1,6 @@
 from contextlib import suppress
 
-from .common import DockerContainer, EphemeralDockerImage, WebContainer
+from .common import DockerContainer, DockerContainerGroup, EphemeralDockerImage, SharedDockerContainer, WebContainer
 from .dynamodb_admin import DynamoDBAdminContainer
 from .localstack import LocalStackContainer
 from .minio import MinioContainer
@@ -23,6 +23,7 @@ with suppress(ImportError):  # 'sftp' extra dependency
 __all__ = [
     "DatabaseContainer",
     "DockerContainer",
+    "DockerContainerGroup",
     "DynamoDBAdminContainer",
     "EphemeralDockerImage",
     "LocalStackContainer",
@@ -31,6 +32,7 @@ __all__ = [
     "MySQLContainer",
     "PostgreSQLContainer",
     "SFTPContainer",
+    "SharedDockerContainer",
     "TomodachiContainer",
     "WebContainer",
     "WireMockContainer",
@@ -1,7 +1,9 @@
 from contextlib import suppress
 
 from .container import DockerContainer
+from .group import DockerContainerGroup
 from .image import EphemeralDockerImage
+from .shared import SharedDockerContainer
 from .web import WebContainer
 
 with suppress(ImportError):  # 'db' extra dependency
@@ -11,6 +13,8 @@ with suppress(ImportError):  # 'db' extra dependency
 __all__ = [
     "DatabaseContainer",
     "DockerContainer",
+    "DockerContainerGroup",
     "EphemeralDockerImage",
+    "SharedDockerContainer",
     "WebContainer",
 ]
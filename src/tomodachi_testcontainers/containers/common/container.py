@@ -1,7 +1,12 @@
 import abc
+import asyncio
+import hashlib
+import json
 import logging
 import os
+import weakref
 from contextlib import suppress
+from datetime import UTC, datetime
 from types import TracebackType
 from typing import Any, Self, cast
 
@@ -12,19 +17,43 @@ from docker.models.containers import Container
 
 from tomodachi_testcontainers.utils import setup_logger
 
+from .logs import ContainerLogBuffer, ContainerLogCursor, ContainerLogForwarder
+
+REUSE_HASH_LABEL = "tomodachi-testcontainers.reuse-hash"
+LOG_FORWARDER_DRAIN_TIMEOUT = 1.0
+
+_running_containers: "weakref.WeakSet[DockerContainer]" = weakref.WeakSet()
+
 
 class ContainerWithSameNameAlreadyExistsError(Exception):
     pass
 
 
+def get_running_containers() -> list["DockerContainer"]:
+    """Returns containers started in the current process that haven't been stopped yet."""
+    return list(_running_containers)
+
+
 class DockerContainer(testcontainers.core.container.DockerContainer, abc.ABC):
-    """Abstract class for generic Docker containers."""
+    """Abstract class for generic Docker containers.
+
+    When `reuse=True`, the container is identified by a stable hash of its configuration
+    (image, environment variables, command, container ports, volumes and network).
+    A running container with the same hash is attached to instead of starting a new one,
+    and the container is left running when the context manager exits, so that it can be reused
+    by the next test session. Host ports are not part of the hash - they're read back from the reused container.
+
+    When used as a context manager, container logs are forwarded to the logger in real time
+    by a background `ContainerLogForwarder`, unless `disable_logging=True`.
+    The most recent log lines of a started container are kept in a `ContainerLogBuffer`,
+    which is used for attaching the logs emitted during a failed test to its pytest report.
+    """
 
     _container: Container | None
     _name: str
     _logger: logging.Logger
 
-    def __init__(self, *args: Any, disable_logging: bool = False, **kwargs: Any) -> None:
+    def __init__(self, *args: Any, disable_logging: bool = False, reuse: bool = False, **kwargs: Any) -> None:
         self._set_container_network()
 
         super().__init__(*args, **kwargs, network=self.network)
@@ -32,23 +61,45 @@ class DockerContainer(testcontainers.core.container.DockerContainer, abc.ABC):
         self._set_default_container_name()
 
         self._disable_logging = disable_logging
+        self._reuse = reuse
+        self._reused = False
+        self._existing_container_id: str | None = None
+        self._started_at: datetime | None = None
+        self._inspect: dict[str, Any] | None = None
+        self._log_forwarding_enabled = False
+        self._log_forwarder: ContainerLogForwarder | None = None
+        self._log_buffer = ContainerLogBuffer()
+        self._log_cursor = ContainerLogCursor(self._log_buffer)
+        self._tmpfs: dict[str, str] = {}
+        self._host_ports: dict[str, int] = {}
 
     def __enter__(self) -> Self:
+        self._enable_log_forwarding()
         try:
             return self.start()
         except ContainerWithSameNameAlreadyExistsError:
             raise
         except Exception:
-            self._forward_container_logs_to_logger()
+            if not self._log_forwarding_enabled:
+                self._forward_container_logs_to_logger()
             self.stop()
             raise
 
     def __exit__(
         self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
     ) -> None:
-        if not self._disable_logging:
-            self._forward_container_logs_to_logger()
-        self.stop()
+        if self._reuse:
+            self._detach()
+        else:
+            self.stop()
+
+    async def __aenter__(self) -> Self:
+        return await asyncio.to_thread(self.__enter__)
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        await asyncio.to_thread(self.__exit__, exc_type, exc_val, exc_tb)
 
     @abc.abstractmethod
     def log_message_on_container_start(self) -> str:
@@ -61,22 +112,107 @@ class DockerContainer(testcontainers.core.container.DockerContainer, abc.ABC):
         return self.docker_inspect()["NetworkSettings"]["Networks"][self.network]["Gateway"]
 
     def docker_inspect(self) -> dict[str, Any]:
-        return self.get_docker_client().get_container(self.get_wrapped_container().id)
+        """Returns a cached `docker inspect` snapshot of the container.
+
+        The snapshot is taken on the first call and invalidated on `restart()` and `stop()`,
+        so repeated endpoint lookups don't make a Docker API call each.
+        Use `refresh_inspect()` to read the container's current state.
+        """
+        if self._inspect is None:
+            return self.refresh_inspect()
+        return self._inspect
+
+    def refresh_inspect(self) -> dict[str, Any]:
+        """Inspects the container and replaces the cached `docker inspect` snapshot."""
+        self._inspect = self.get_docker_client().get_container(self.get_wrapped_container().id)
+        return self._inspect
+
+    def get_log_cursor(self) -> ContainerLogCursor:
+        """Returns the container's log cursor that reads only the logs emitted since the last read."""
+        return self._log_cursor
+
+    def get_log_buffer(self) -> ContainerLogBuffer:
+        """Returns the container's buffer of the most recent log lines."""
+        return self._log_buffer
 
     def start(self) -> "DockerContainer":
+        self._started_at = datetime.now(UTC)
+        reused = self._reused = self._attach_to_existing_container()
         self._setup_logger()
-        self._start()
+        if reused:
+            self._logger.info(f"Reusing container: {self._name}")
+        else:
+            self._start()
+        self._sync_edge_ports()
+        _running_containers.add(self)
+        self._start_log_forwarder(since=self._started_at if reused else None)
         self._log_message_on_container_start()
         return self
 
+    async def astart(self) -> Self:
+        """Starts the container without blocking the event loop.
+
+        Docker API calls and healthchecks run in the event loop's default thread pool executor,
+        so several containers can be started concurrently with `asyncio.gather`.
+        """
+        await asyncio.to_thread(self.start)
+        return self
+
+    async def astop(self) -> None:
+        """Stops the container without blocking the event loop."""
+        await asyncio.to_thread(self.stop)
+
     def stop(self) -> None:
         with suppress(Exception):
             container = self._container or cast("Container", self.get_docker_client().client.containers.get(self._name))
             container.remove(force=True, v=True)
+        self._stop_log_forwarder(timeout=LOG_FORWARDER_DRAIN_TIMEOUT)
+        _running_containers.discard(self)
         self._container = None
+        self._inspect = None
 
     def restart(self) -> None:
+        """Restarts the container.
+
+        Docker assigns new ephemeral host ports when the container starts again, so host port attributes
+        like `edge_port` are updated, and clients created with the previous host ports must be recreated.
+        Pass explicit host ports, e.g., `edge_port`, to keep the host ports unchanged.
+        """
+        self._inspect = None
+        restarted_at = datetime.now(UTC)
         self.get_wrapped_container().restart()
+        self._load_port_bindings(self.docker_inspect())
+        self._sync_edge_ports()
+        if self._log_forwarder is not None:
+            # The log stream ends when the container stops - follow the restarted container's logs with a new stream
+            self._stop_log_forwarder(timeout=LOG_FORWARDER_DRAIN_TIMEOUT)
+            self._start_log_forwarder(since=restarted_at)
+
+    def with_tmpfs_mount(self, container_path: str, size: str | None = None) -> Self:
+        """Mounts a tmpfs on the container path, optionally limited to `size`, e.g., `256m` or `1g`."""
+        # Kept on the class instead of upstream's `tmpfs` attribute, which is not available in all supported versions
+        self._tmpfs[container_path] = f"size={size}" if size else ""
+        return self
+
+    def with_existing_container(self, container_id: str | None) -> Self:
+        """Attaches to an already running container on start instead of starting a new one."""
+        self._existing_container_id = container_id
+        return self
+
+    def get_reuse_hash(self) -> str:
+        """Returns a stable hash of the container configuration used for finding a reusable container."""
+        config = {
+            "class": self.__class__.__name__,
+            "image": self.image,
+            "env": self.env,
+            "command": self._command,
+            "ports": sorted(self.ports),
+            "volumes": self.volumes,
+            "tmpfs": self._tmpfs,
+            "network": self.network,
+            "kwargs": self._kwargs,
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()
 
     def _set_container_network(self) -> None:
         self.network = os.getenv("TESTCONTAINER_DOCKER_NETWORK") or "bridge"
@@ -87,8 +223,75 @@ class DockerContainer(testcontainers.core.container.DockerContainer, abc.ABC):
     def _setup_logger(self) -> None:
         self._logger = setup_logger(f"{self.__class__.__name__} ({self._name})")
 
+    def _get_host_port(self, internal_port: int) -> int:
+        for container_port, host_port in self._host_ports.items():
+            if container_port.split("/")[0] == str(internal_port):
+                return host_port
+        raise KeyError(internal_port)
+
+    def _bind_edge_port(self, internal_port: int, edge_port: int | None) -> int:
+        """Binds the container port to the host port, or to an ephemeral host port if `edge_port` is not given.
+
+        The ephemeral host port is assigned by Docker when the container starts, so unlike picking a free port
+        up front, it can't be taken by another process in the meantime, e.g., by another pytest-xdist worker.
+        Returns the host port, or `0` until the ephemeral host port is assigned - see `_sync_edge_ports`.
+        """
+        if edge_port:
+            self.with_bind_ports(internal_port, edge_port)
+            return edge_port
+        self.with_exposed_ports(internal_port)
+        return 0
+
+    def _sync_edge_ports(self) -> None:
+        """Updates host port attributes after the host ports are assigned on start; overridden in subclasses."""
+
+    def _attach_to_existing_container(self) -> bool:
+        if self._existing_container_id:
+            self._attach(cast("Container", self.get_docker_client().client.containers.get(self._existing_container_id)))
+            return True
+        if not self._reuse:
+            return False
+        reuse_hash = self.get_reuse_hash()
+        containers = cast(
+            "list[Container]",
+            self.get_docker_client().client.containers.list(
+                all=True, filters={"label": f"{REUSE_HASH_LABEL}={reuse_hash}"}
+            ),
+        )
+        for container in containers:
+            if container.status != "running":
+                with suppress(Exception):
+                    container.remove(force=True, v=True)
+                continue
+            self._attach(container)
+            return True
+        self._kwargs["labels"] = {**self._kwargs.get("labels", {}), REUSE_HASH_LABEL: reuse_hash}
+        return False
+
+    def _attach(self, container: Container) -> None:
+        self._container = container
+        self._inspect = None
+        self._name = str(container.name)
+        self._reused = True
+        self._load_port_bindings(container.attrs)
+
+    def _load_port_bindings(self, inspect: dict[str, Any]) -> None:
+        """Reads the host ports bound to the container; requested port bindings in `ports` are left unchanged."""
+        port_bindings: dict[str, list[dict[str, str]] | None] = inspect["NetworkSettings"]["Ports"] or {}
+        self._host_ports = {}
+        for container_port in map(str, self.ports):
+            key = container_port if "/" in container_port else f"{container_port}/tcp"
+            if bindings := port_bindings.get(key):
+                # Docker binds both IPv4 and IPv6 addresses - prefer the IPv4 binding
+                binding = next((b for b in bindings if ":" not in b["HostIp"]), bindings[0])
+                self._host_ports[key] = int(binding["HostPort"])
+
     def _start(self) -> None:
         self._logger.info(f"Pulling image: {self.image}")
+        kwargs = dict(self._kwargs)
+        if self._tmpfs:
+            kwargs["tmpfs"] = {**kwargs.get("tmpfs", {}), **self._tmpfs}
+        self._inspect = None
         try:
             self._container = self.get_docker_client().run(
                 image=self.image,
@@ -99,7 +302,7 @@ class DockerContainer(testcontainers.core.container.DockerContainer, abc.ABC):
                 name=self._name,
                 volumes=self.volumes,
                 network=self.network,
-                **self._kwargs,
+                **kwargs,
             )
         except Exception as e:
             self._logger.exception("Failed to start the container")
@@ -108,13 +311,39 @@ class DockerContainer(testcontainers.core.container.DockerContainer, abc.ABC):
             raise
         else:
             self._logger.info(f"Container started: {self._name}")
+        # Read back the ephemeral host ports assigned by Docker; the inspect snapshot is reused for endpoint lookups
+        self._load_port_bindings(self.docker_inspect())
 
     def _log_message_on_container_start(self) -> None:
         if message := self.log_message_on_container_start():
             self._logger.info(message)
 
+    def _enable_log_forwarding(self) -> None:
+        """Forwards the container logs to the logger, unless logging is disabled; used by context managers."""
+        self._log_forwarding_enabled = not self._disable_logging
+
+    def _detach(self) -> None:
+        """Stops following the logs of a container that is left running, e.g., a reused or shared container."""
+        self._stop_log_forwarder()
+        _running_containers.discard(self)
+
+    def _start_log_forwarder(self, since: datetime | None) -> None:
+        # Outside of the context manager, the logs are only kept in the log buffer
+        logger = self._logger if self._log_forwarding_enabled else None
+        self._log_forwarder = ContainerLogForwarder(
+            self.get_wrapped_container(), logger, since=since, buffer=self._log_buffer
+        )
+        self._log_forwarder.start()
+
+    def _stop_log_forwarder(self, timeout: float = 0) -> None:
+        if self._log_forwarder is not None:
+            self._log_forwarder.stop(timeout)
+            self._log_forwarder = None
+
     def _forward_container_logs_to_logger(self) -> None:
         if container := self.get_wrapped_container():
-            logs = bytes(container.logs(timestamps=False)).decode().split("\n")
-            for log in logs:
-                self._logger.info(log)
+            # A reused container holds logs from previous test sessions - forward only the current session's logs
+            since = self._started_at if self._reused else None
+            forwarder = ContainerLogForwarder(container, self._logger, since=since, follow=False)
+            forwarder.start()
+            forwarder.stop(timeout=None)
@@ -1,14 +1,15 @@
 """Abstract relational database container."""
 
 import abc
+from collections.abc import Generator
+from contextlib import contextmanager
 from typing import Any, NamedTuple
 
 import sqlalchemy
+from sqlalchemy.pool import NullPool
 from tenacity import Retrying
 from tenacity.stop import stop_after_delay
-from tenacity.wait import wait_fixed
-
-from tomodachi_testcontainers.utils import get_available_port
+from tenacity.wait import wait_exponential
 
 from .container import DockerContainer
 
@@ -49,8 +50,7 @@ class DatabaseContainer(DockerContainer, abc.ABC):
     ) -> None:
         super().__init__(image, disable_logging=disable_logging, **kwargs)
         self.internal_port = internal_port
-        self.edge_port = edge_port or get_available_port()
-        self.with_bind_ports(internal_port, self.edge_port)
+        self.edge_port = self._bind_edge_port(internal_port, edge_port)
 
     def get_internal_url(self) -> DatabaseURL:
         return DatabaseURL(
@@ -77,10 +77,58 @@ class DatabaseContainer(DockerContainer, abc.ABC):
         wait_for_database_healthcheck(url=self.get_external_url(), timeout=timeout)
         return self
 
+    def create_database(self, name: str) -> None:
+        """Creates a new database on the database server, replacing an existing database with the same name.
+
+        Implemented by `PostgreSQLContainer` and `MySQLContainer`; override it in custom database containers
+        to support `separate_database()`.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} doesn't support separate databases - override create_database() and drop_database()"
+        )
+
+    def drop_database(self, name: str) -> None:
+        """Drops the database from the database server if it exists."""
+        raise NotImplementedError(
+            f"{type(self).__name__} doesn't support separate databases - override create_database() and drop_database()"
+        )
+
+    @contextmanager
+    def separate_database(self, name: str) -> Generator["DatabaseContainer", None, None]:
+        """Creates a separate database on the same database server and points the container URLs to it.
+
+        `get_external_url()` and `get_internal_url()` return the separate database URL until the context manager exits,
+        and the database is dropped on exit. Used for isolating pytest-xdist workers or tests
+        that share one database server, instead of starting a database container for each of them.
+        """
+        original_database = self.database
+        self.create_database(name)
+        self.database = name
+        try:
+            yield self
+        finally:
+            self.database = original_database
+            self.drop_database(name)
+
+    def _sync_edge_ports(self) -> None:
+        self.edge_port = self._get_host_port(self.internal_port)
+
 
 def wait_for_database_healthcheck(url: DatabaseURL, timeout: float = 20.0, interval: float = 0.5) -> None:
-    for attempt in Retrying(stop=stop_after_delay(timeout), wait=wait_fixed(interval), reraise=True):
-        with attempt:
-            engine = sqlalchemy.create_engine(str(url))
-            with engine.connect() as conn:
+    """Waits until the database accepts connections.
+
+    Checks are frequent at first and back off exponentially up to `interval` seconds.
+    A TCP connection alone isn't checked,
+    because Docker's port proxy accepts connections before the database is listening.
+    """
+    engine = sqlalchemy.create_engine(str(url), poolclass=NullPool)
+    try:
+        for attempt in Retrying(
+            stop=stop_after_delay(timeout),
+            wait=wait_exponential(multiplier=0.05, max=interval),
+            reraise=True,
+        ):
+            with attempt, engine.connect() as conn:
                 conn.execute(sqlalchemy.text("SELECT 1;"))
+    finally:
+        engine.dispose()
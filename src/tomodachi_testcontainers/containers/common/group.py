@@ -0,0 +1,54 @@
+"""Group of independent containers started concurrently."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+
+from .container import DockerContainer
+
+
+class DockerContainerGroup:
+    """Starts a group of independent containers concurrently and stops them when the context manager exits.
+
+    Containers are started on a thread pool, so their startup and healthchecks overlap,
+    and the group is ready as soon as the slowest container is ready.
+    If any of the containers fails to start, the already started containers are stopped,
+    and the first error is raised.
+    """
+
+    containers: tuple[DockerContainer, ...]
+
+    def __init__(self, *containers: DockerContainer, max_workers: int | None = None) -> None:
+        self.containers = containers
+        self._max_workers = max_workers or max(len(containers), 1)
+
+    def __enter__(self) -> tuple[DockerContainer, ...]:
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="testcontainers") as executor:
+            futures = [executor.submit(container.__enter__) for container in self.containers]
+
+        errors = [error for future in futures if (error := future.exception()) is not None]
+        if errors:
+            started = [c for c, f in zip(self.containers, futures, strict=True) if f.exception() is None]
+            self._exit_containers(started, type(errors[0]), errors[0], errors[0].__traceback__)
+            raise errors[0]
+        return self.containers
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        self._exit_containers(list(self.containers), exc_type, exc_val, exc_tb)
+
+    def _exit_containers(
+        self,
+        containers: list[DockerContainer],
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if not containers:
+            return
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="testcontainers") as executor:
+            futures: list[Future[None]] = [
+                executor.submit(container.__exit__, exc_type, exc_val, exc_tb) for container in containers
+            ]
+        for future in futures:
+            future.result()
@@ -1,17 +1,31 @@
+import hashlib
 import os
 import subprocess  # nosec: B404
 from collections.abc import Iterator
+from contextlib import suppress
 from pathlib import Path
 from types import TracebackType
 from typing import cast
 
-from docker.errors import BuildError
+from docker.errors import APIError, BuildError, ImageNotFound
 from docker.models.images import Image
+from docker.utils.build import exclude_paths
 from testcontainers.core.docker_client import DockerClient
 
+CACHED_IMAGE_REPOSITORY = "tomodachi-testcontainers-cache"
+CACHE_KEY_LABEL = "tomodachi-testcontainers.cache-key"
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class EphemeralDockerImage:
-    """Builds a Docker image from a given Dockerfile and removes it when the context manager exits."""
+    """Builds a Docker image from a given Dockerfile and removes it when the context manager exits.
+
+    When `cache=True`, the image is tagged with a content hash of the Dockerfile, build target and build context
+    (respecting `.dockerignore`), and the build is skipped if an image with the same tag already exists.
+    Cached images are not removed when the context manager exits. Cached images are labeled with a key
+    of the Dockerfile path, build context path and build target, and when a new image is built for the same key,
+    the previously cached images are removed.
+    """
 
     image: Image
 
@@ -23,12 +37,16 @@ class EphemeralDockerImage:
         docker_client_kwargs: dict | None = None,
         *,
         remove_image_on_exit: bool = True,
+        cache: bool = False,
     ) -> None:
         self.dockerfile = str(dockerfile) if dockerfile else None
         self.context = str(context) if context else "."
         self.target = target
         self._docker_client = DockerClient(**(docker_client_kwargs or {}))
-        self._remove_image_on_exit = remove_image_on_exit
+        self._remove_image_on_exit = remove_image_on_exit and not cache
+        self._cache = cache
+        self._tag: str | None = None
+        self._cache_key: str | None = None
 
     def __enter__(self) -> Image:
         return self._build_image()
@@ -39,18 +57,58 @@ class EphemeralDockerImage:
         if self._remove_image_on_exit:
             self._remove_image()
 
+    def get_content_hash(self) -> str:
+        """Returns a hash of the Dockerfile, build target and build context files not excluded by `.dockerignore`."""
+        context = Path(self.context)
+        dockerfile = Path(self.dockerfile) if self.dockerfile else context / "Dockerfile"
+        content_hash = hashlib.sha256()
+        _update_hash_with_file(content_hash, dockerfile)
+        content_hash.update((self.target or "").encode())
+        for path in sorted(exclude_paths(str(context), self._read_dockerignore_patterns())):
+            file_path = context / path
+            if file_path.is_file() and not file_path.is_symlink():
+                content_hash.update(path.encode() + b"\0")
+                _update_hash_with_file(content_hash, file_path)
+        return content_hash.hexdigest()
+
     def _build_image(self) -> Image:
+        if self._cache:
+            self._tag = f"{CACHED_IMAGE_REPOSITORY}:{self.get_content_hash()}"
+            with suppress(ImageNotFound):
+                self.image = cast("Image", self._docker_client.client.images.get(self._tag))
+                return self.image
+            self._cache_key = self._get_cache_key()
         if os.getenv("DOCKER_BUILDKIT"):
             self.image = self._build_with_docker_buildkit_cli()
         else:
             self.image = self._build_with_docker_client()
+        if self._cache_key:
+            self._remove_stale_cached_images(self._cache_key)
         return self.image
 
+    def _get_cache_key(self) -> str:
+        context = Path(self.context).resolve()
+        dockerfile = Path(self.dockerfile).resolve() if self.dockerfile else context / "Dockerfile"
+        return hashlib.sha256(f"{dockerfile}\0{context}\0{self.target or ''}".encode()).hexdigest()
+
+    def _remove_stale_cached_images(self, cache_key: str) -> None:
+        images = cast(
+            "list[Image]", self._docker_client.client.images.list(filters={"label": f"{CACHE_KEY_LABEL}={cache_key}"})
+        )
+        for image in images:
+            if image.id != self.image.id:
+                with suppress(APIError):  # The image is used by a container or has other tags
+                    self._docker_client.client.images.remove(image=str(image.id))
+
     def _remove_image(self) -> None:
         self._docker_client.client.images.remove(image=str(self.image.id))
 
     def _build_with_docker_buildkit_cli(self) -> Image:
         cmd = ["docker", "build", "-q", "--rm=true"]
+        if self._tag:
+            cmd.extend(["-t", self._tag])
+        if self._cache_key:
+            cmd.extend(["--label", f"{CACHE_KEY_LABEL}={self._cache_key}"])
         if self.dockerfile:
             cmd.extend(["-f", self.dockerfile])
         if self.target:
@@ -77,7 +135,22 @@ class EphemeralDockerImage:
                 dockerfile=self.dockerfile,
                 path=self.context,
                 target=self.target,
+                tag=self._tag,
+                labels={CACHE_KEY_LABEL: self._cache_key} if self._cache_key else None,
                 forcerm=True,
             ),
         )
         return image
+
+    def _read_dockerignore_patterns(self) -> list[str]:
+        dockerignore = Path(self.context) / ".dockerignore"
+        if not dockerignore.exists():
+            return []
+        lines = (line.strip() for line in dockerignore.read_text(encoding="utf-8").splitlines())
+        return [line for line in lines if line and not line.startswith("#")]
+
+
+def _update_hash_with_file(content_hash: "hashlib._Hash", path: Path) -> None:
+    with path.open("rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            content_hash.update(chunk)
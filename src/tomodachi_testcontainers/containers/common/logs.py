@@ -0,0 +1,228 @@
+"""Incremental container log reading and forwarding."""
+
+import codecs
+import json
+import logging
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import suppress
+from datetime import datetime
+
+from docker.models.containers import Container
+
+_LOG_LEVELS = {
+    "trace": logging.DEBUG,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "notice": logging.INFO,
+    "warn": logging.WARNING,
+    "warning": logging.WARNING,
+    "err": logging.ERROR,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+}
+_JSON_LOG_LEVEL_KEYS = ("level", "levelname", "log.level", "severity")
+_CONSOLE_LOG_LEVEL_PATTERN = re.compile(r"\[\s*(" + "|".join(_LOG_LEVELS) + r")\s*\]", re.IGNORECASE)
+_ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class ContainerLogCursor:
+    """Reads container logs incrementally from the container's `ContainerLogBuffer`.
+
+    The buffer is filled by the `ContainerLogForwarder` that follows the container's logs on a background thread,
+    so reading the logs doesn't request them from Docker. `read()` returns only the log lines appended
+    since the last read, and `position()` marks the current end of the log, so that the logs can be scoped
+    to a single test with `lines(since=position)`.
+    """
+
+    def __init__(self, buffer: "ContainerLogBuffer") -> None:
+        self._buffer = buffer
+        self._read_position = 0
+        self._lock = threading.Lock()
+
+    def read(self) -> list[str]:
+        """Returns the log lines appended since the last read."""
+        with self._lock:
+            self._read_position, lines = self._buffer.read(since=self._read_position)
+            return lines
+
+    def position(self) -> int:
+        """Returns the number of log lines emitted so far; use it as the `since` argument to scope logs."""
+        return self._buffer.position()
+
+    def lines(self, since: int = 0) -> list[str]:
+        """Returns the buffered log lines emitted since the given position."""
+        return self._buffer.lines(since=since)
+
+
+class ContainerLogBuffer:
+    """Keeps the most recent container log lines in memory, up to `max_bytes` of UTF-8 encoded lines.
+
+    Lines are stored as bytes in a ring buffer - the oldest lines are discarded when the buffer is full,
+    so memory usage stays constant regardless of the size of the container's log.
+    `position()` marks the current end of the log, so that the logs can be scoped to a single test
+    with `lines(since=position)`.
+    """
+
+    def __init__(self, max_bytes: int = 1024 * 1024) -> None:
+        self._max_bytes = max_bytes
+        self._lines: deque[bytes] = deque()
+        self._size = 0
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def append(self, line: str) -> None:
+        """Appends a log line, discarding the oldest lines if the buffer is full."""
+        encoded_line = line.encode(errors="replace")[: self._max_bytes]
+        with self._lock:
+            self._lines.append(encoded_line)
+            self._size += len(encoded_line)
+            self._position += 1
+            while self._size > self._max_bytes:
+                self._size -= len(self._lines.popleft())
+
+    def position(self) -> int:
+        """Returns the number of log lines appended so far; use it as the `since` argument to scope logs."""
+        with self._lock:
+            return self._position
+
+    def lines(self, since: int = 0) -> list[str]:
+        """Returns the buffered log lines appended since the given position."""
+        return self.read(since)[1]
+
+    def read(self, since: int = 0) -> tuple[int, list[str]]:
+        """Returns the current position and the buffered log lines appended since the given position."""
+        with self._lock:
+            first_buffered_position = self._position - len(self._lines)
+            lines = list(self._lines)[max(since - first_buffered_position, 0) :]
+            position = self._position
+        return position, [line.decode(errors="replace") for line in lines]
+
+
+class ContainerLogForwarder:
+    """Forwards container logs to a logger line by line on a background thread as they are emitted.
+
+    The logs are followed with Docker's streaming logs API, so only the current incomplete line is kept in memory,
+    and lines longer than `max_line_length` are split.
+    JSON log lines with a `level`, `levelname`, `log.level` or `severity` field and structlog console lines
+    like `[error    ] message` are logged with the matching log level; other lines are logged as `INFO`.
+    At most `max_lines_per_second` lines are forwarded per second - the excess lines are dropped,
+    and the number of dropped lines is logged as a warning.
+
+    All log lines, including the dropped ones, are also appended to the `buffer`, if given.
+    Without a `logger`, the log lines are only appended to the `buffer`.
+    """
+
+    def __init__(
+        self,
+        container: Container,
+        logger: logging.Logger | None,
+        since: datetime | None = None,
+        follow: bool = True,
+        buffer: ContainerLogBuffer | None = None,
+        max_lines_per_second: int = 1000,
+        max_line_length: int = 16384,
+    ) -> None:
+        self._container = container
+        self._logger = logger
+        self._since = since
+        self._follow = follow
+        self._buffer = buffer
+        self._max_lines_per_second = max_lines_per_second
+        self._max_line_length = max_line_length
+        self._stream: Iterator[bytes] | None = None
+        self._thread: threading.Thread | None = None
+        self._dropped_lines = 0
+        self._tokens = float(max_lines_per_second)
+        self._tokens_updated_at = time.monotonic()
+
+    def start(self) -> None:
+        """Starts forwarding the logs on a background thread."""
+        self._stream = self._container.logs(stream=True, follow=self._follow, since=self._since)
+        self._thread = threading.Thread(target=self._forward_logs, name="testcontainers-log-forwarder", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 0) -> None:
+        """Waits up to `timeout` seconds (indefinitely if `None`) for the log stream to end, then stops forwarding."""
+        if self._thread is None or self._stream is None:
+            return
+        self._thread.join(timeout)
+        with suppress(Exception):
+            self._stream.close()  # type: ignore[attr-defined]
+        self._thread.join()
+        self._thread = None
+
+    def _forward_logs(self) -> None:
+        with suppress(Exception):  # The stream is closed when the forwarder is stopped
+            for line in self._read_lines(self._stream or iter(())):
+                self._log(line)
+        self._log_dropped_lines()
+
+    def _read_lines(self, stream: Iterator[bytes]) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        incomplete_line = ""
+        for chunk in stream:
+            lines = (incomplete_line + decoder.decode(chunk)).split("\n")
+            incomplete_line = lines.pop()
+            for line in lines:
+                yield from self._split_long_line(line)
+            while len(incomplete_line) > self._max_line_length:
+                yield incomplete_line[: self._max_line_length]
+                incomplete_line = incomplete_line[self._max_line_length :]
+        if incomplete_line := incomplete_line + decoder.decode(b"", final=True):
+            yield from self._split_long_line(incomplete_line)
+
+    def _split_long_line(self, line: str) -> Iterator[str]:
+        if len(line) <= self._max_line_length:
+            yield line
+            return
+        for start in range(0, len(line), self._max_line_length):
+            yield line[start : start + self._max_line_length]
+
+    def _log(self, line: str) -> None:
+        if self._buffer is not None:
+            self._buffer.append(line)
+        if self._logger is None:
+            return
+        if not self._acquire_rate_limit_token():
+            self._dropped_lines += 1
+            return
+        self._log_dropped_lines()
+        self._logger.log(_get_log_level(line), line)
+
+    def _log_dropped_lines(self) -> None:
+        if self._dropped_lines and self._logger is not None:
+            self._logger.warning(
+                f"Dropped {self._dropped_lines} log lines exceeding the rate limit "
+                f"of {self._max_lines_per_second} lines per second"
+            )
+            self._dropped_lines = 0
+
+    def _acquire_rate_limit_token(self) -> bool:
+        now = time.monotonic()
+        elapsed, self._tokens_updated_at = now - self._tokens_updated_at, now
+        self._tokens = min(self._tokens + elapsed * self._max_lines_per_second, float(self._max_lines_per_second))
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+def _get_log_level(line: str) -> int:
+    """Returns the log level of a JSON or structlog console log line, defaulting to `INFO`."""
+    if line.startswith("{"):
+        with suppress(ValueError):
+            record = json.loads(line)
+            if isinstance(record, dict):
+                for key in _JSON_LOG_LEVEL_KEYS:
+                    if isinstance(level := record.get(key), str) and level.lower() in _LOG_LEVELS:
+                        return _LOG_LEVELS[level.lower()]
+        return logging.INFO
+    if match := _CONSOLE_LOG_LEVEL_PATTERN.search(_ANSI_ESCAPE_PATTERN.sub("", line[:200])):
+        return _LOG_LEVELS[match.group(1).lower()]
+    return logging.INFO
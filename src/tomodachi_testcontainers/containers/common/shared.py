@@ -0,0 +1,98 @@
+"""Container shared between multiple processes, e.g., pytest-xdist workers."""
+
+import json
+import os
+import sys
+from contextlib import suppress
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import docker.errors
+from filelock import FileLock
+
+from .container import DockerContainer
+
+
+class SharedDockerContainer:
+    """Shares a container between multiple processes that coordinate through a lock and a state file.
+
+    The first process to enter the context manager starts the container and writes its ID to the state file.
+    Other processes attach to the running container instead of starting a new one,
+    skipping the container's one-time setup, e.g., loading WireMock mappings, and forward its logs to their own logger.
+    The last process to exit the context manager stops the container;
+    other processes only stop following the container's logs.
+
+    The state file lists the IDs of the processes using the container, so that processes that crashed
+    without exiting the context manager are skipped, and the container is still stopped by the last running process.
+    Crashed processes are not detected on Windows, where the container is left running if a process crashes.
+
+    Used for sharing backing services like LocalStack between pytest-xdist workers,
+    so that only one container is started per test run instead of one container per worker.
+    """
+
+    def __init__(self, container: DockerContainer, state_dir: Path, key: str | None = None) -> None:
+        self.container = container
+        self._key = key or container.get_reuse_hash()
+        self._state_file = state_dir / f"tomodachi-testcontainers-{self._key}.json"
+        self._lock = FileLock(f"{self._state_file}.lock")
+
+    def __enter__(self) -> DockerContainer:
+        with self._lock:
+            state = self._read_state()
+            if state and self._attach(state["container_id"]):
+                state["pids"] = [*_get_running_pids(state), os.getpid()]
+            else:
+                self.container.__enter__()
+                state = {"container_id": self.container.get_wrapped_container().id, "pids": [os.getpid()]}
+            self._write_state(state)
+        return self.container
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        with self._lock:
+            state = self._read_state()
+            pids = _get_running_pids(state)
+            with suppress(ValueError):
+                pids.remove(os.getpid())
+            if pids:
+                self._write_state({**state, "pids": pids})
+                # Other processes still use the container - leave it running
+                self.container._detach()
+                return
+            self._state_file.unlink(missing_ok=True)
+            self.container.__exit__(exc_type, exc_val, exc_tb)
+
+    def _attach(self, container_id: str) -> bool:
+        self.container._enable_log_forwarding()
+        try:
+            self.container.with_existing_container(container_id).start()
+        except docker.errors.NotFound:
+            self.container.with_existing_container(None)
+            return False
+        return True
+
+    def _read_state(self) -> dict[str, Any]:
+        if not self._state_file.exists():
+            return {}
+        return json.loads(self._state_file.read_text(encoding="utf-8"))
+
+    def _write_state(self, state: dict[str, Any]) -> None:
+        self._state_file.write_text(json.dumps(state), encoding="utf-8")
+
+
+def _get_running_pids(state: dict[str, Any]) -> list[int]:
+    return [pid for pid in state.get("pids", []) if _is_process_running(pid)]
+
+
+def _is_process_running(pid: int) -> bool:
+    if sys.platform == "win32":
+        return True  # os.kill terminates the process on Windows instead of checking it
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # The process exists, but belongs to another user
+        return True
+    return True
@@ -0,0 +1,61 @@
+"""Wait strategies for checking container readiness."""
+
+import codecs
+import re
+import threading
+from collections.abc import Iterator
+from contextlib import suppress
+
+from testcontainers.core.waiting_utils import WaitStrategy, WaitStrategyTarget
+
+
+class StreamingLogMessageWaitStrategy(WaitStrategy):
+    """Waits for a message to appear in the container logs.
+
+    Unlike `testcontainers`' `LogMessageWaitStrategy`, which fetches and scans the whole log on every poll,
+    the logs are followed with Docker's streaming logs API and scanned incrementally line by line,
+    so the wait finishes as soon as the message is logged.
+
+    Raises `TimeoutError` if the message doesn't appear within the startup timeout,
+    and `RuntimeError` if the container exits before emitting the message.
+    """
+
+    def __init__(self, message: str | re.Pattern[str]) -> None:
+        super().__init__()
+        self._message = message if isinstance(message, re.Pattern) else re.compile(message, re.MULTILINE)
+
+    def wait_until_ready(self, container: WaitStrategyTarget) -> None:
+        stream = container.get_wrapped_container().logs(stream=True, follow=True)
+        found = threading.Event()
+        finished = threading.Event()
+
+        def _follow_logs() -> None:
+            with suppress(Exception):  # The stream is closed when the wait times out
+                if self._scan_logs(stream):
+                    found.set()
+            finished.set()
+
+        threading.Thread(target=_follow_logs, name="testcontainers-log-wait", daemon=True).start()
+        timed_out = not finished.wait(self._startup_timeout)
+        stream.close()
+
+        if found.is_set():
+            return
+        if timed_out:
+            raise TimeoutError(
+                f"Container did not emit logs containing '{self._message.pattern}' "
+                f"within {self._startup_timeout:.3f} seconds"
+            )
+        raise RuntimeError(f"Container exited before emitting logs containing '{self._message.pattern}'")
+
+    def _scan_logs(self, stream: Iterator[bytes]) -> bool:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        incomplete_line = ""
+        for chunk in stream:
+            lines = (incomplete_line + decoder.decode(chunk)).splitlines(keepends=True)
+            incomplete_line = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+            if any(self._message.search(line) for line in lines):
+                return True
+            if incomplete_line and self._message.search(incomplete_line):
+                return True
+        return False
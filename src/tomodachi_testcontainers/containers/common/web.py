@@ -7,9 +7,7 @@ from typing import Any
 import requests
 from tenacity import Retrying
 from tenacity.stop import stop_after_delay
-from tenacity.wait import wait_fixed
-
-from tomodachi_testcontainers.utils import get_available_port
+from tenacity.wait import wait_exponential
 
 from .container import DockerContainer
 
@@ -31,9 +29,8 @@ class WebContainer(DockerContainer, abc.ABC):
     ) -> None:
         super().__init__(image, disable_logging=disable_logging, **kwargs)
         self.internal_port = internal_port
-        self.edge_port = edge_port or get_available_port()
+        self.edge_port = self._bind_edge_port(internal_port, edge_port)
         self.http_healthcheck_path = http_healthcheck_path
-        self.with_bind_ports(internal_port, self.edge_port)
 
     def get_internal_url(self) -> str:
         ip = self.get_container_internal_ip()
@@ -50,6 +47,9 @@ class WebContainer(DockerContainer, abc.ABC):
             wait_for_http_healthcheck(url=url)
         return self
 
+    def _sync_edge_ports(self) -> None:
+        self.edge_port = self._get_host_port(self.internal_port)
+
 
 def wait_for_http_healthcheck(
     url: str,
@@ -59,12 +59,18 @@ def wait_for_http_healthcheck(
     retries: int = 3,
     status_code: int = 200,
 ) -> None:
-    for attempt in Retrying(
-        stop=stop_after_delay(start_period + (timeout * retries)),
-        wait=wait_fixed(interval),
-        reraise=True,
-    ):
-        with attempt:
-            response = requests.get(url, timeout=timeout)
-            if response.status_code != status_code:
-                raise RuntimeError(f"Healthcheck failed with HTTP status code: {response.status_code}")
+    """Waits until the HTTP endpoint responds with the expected status code.
+
+    Checks are frequent at first and back off exponentially up to `interval` seconds.
+    Requests reuse one pooled HTTP connection.
+    """
+    with requests.Session() as session:
+        for attempt in Retrying(
+            stop=stop_after_delay(start_period + (timeout * retries)),
+            wait=wait_exponential(multiplier=0.05, max=interval),
+            reraise=True,
+        ):
+            with attempt:
+                response = session.get(url, timeout=timeout)
+                if response.status_code != status_code:
+                    raise RuntimeError(f"Healthcheck failed with HTTP status code: {response.status_code}")
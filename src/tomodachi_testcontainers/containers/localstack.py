@@ -1,11 +1,10 @@
 import os
 from typing import Any
 
-from testcontainers.core.wait_strategies import LogMessageWaitStrategy
-
-from tomodachi_testcontainers.utils import AWSClientConfig
+from tomodachi_testcontainers.utils import AWSClientConfig, get_available_port
 
 from .common import WebContainer
+from .common.wait_strategies import StreamingLogMessageWaitStrategy
 
 
 class LocalStackContainer(WebContainer):
@@ -30,7 +29,8 @@ class LocalStackContainer(WebContainer):
         super().__init__(
             image,
             internal_port=internal_port,
-            edge_port=edge_port,
+            # The host port is bound explicitly to keep it on restart, so session-scoped AWS clients keep working
+            edge_port=edge_port or get_available_port(),
             http_healthcheck_path="/_localstack/health",
             disable_logging=disable_logging,
             **kwargs,
@@ -62,5 +62,5 @@ class LocalStackContainer(WebContainer):
 
     def start(self) -> "LocalStackContainer":
         super().start()
-        LogMessageWaitStrategy(r"Ready\.\n").with_startup_timeout(10).wait_until_ready(self)
+        StreamingLogMessageWaitStrategy(r"Ready\.\n").with_startup_timeout(10).wait_until_ready(self)
         return self
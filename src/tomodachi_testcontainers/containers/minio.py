@@ -1,7 +1,7 @@
 import os
 from typing import Any
 
-from tomodachi_testcontainers.utils import AWSClientConfig, get_available_port
+from tomodachi_testcontainers.utils import AWSClientConfig
 
 from .common import WebContainer
 
@@ -38,9 +38,7 @@ class MinioContainer(WebContainer):
         self.s3_api_internal_port = s3_api_internal_port
         self.s3_api_edge_port = self.edge_port
         self.console_internal_port = console_internal_port
-        self.console_edge_port = console_edge_port or get_available_port()
-
-        self.with_bind_ports(console_internal_port, self.console_edge_port)
+        self.console_edge_port = self._bind_edge_port(console_internal_port, console_edge_port)
 
         self.region_name = region_name or os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
         self.minio_root_user = os.getenv("MINIO_ROOT_USER") or "minioadmin"  # nosec: B105
@@ -70,3 +68,8 @@ class MinioContainer(WebContainer):
 
     def reset_minio(self) -> None:
         self.exec(["mc", "rm", "--recursive", "--dangerous", "--force", "data/"])
+
+    def _sync_edge_ports(self) -> None:
+        super()._sync_edge_ports()
+        self.s3_api_edge_port = self.edge_port
+        self.console_edge_port = self._get_host_port(self.console_internal_port)
@@ -1,11 +1,10 @@
 import os
 from typing import Any
 
-from testcontainers.core.wait_strategies import LogMessageWaitStrategy
-
 from tomodachi_testcontainers.utils import AWSClientConfig
 
 from .common import WebContainer
+from .common.wait_strategies import StreamingLogMessageWaitStrategy
 
 
 class MotoContainer(WebContainer):
@@ -64,7 +63,7 @@ class MotoContainer(WebContainer):
 
     def start(self) -> "MotoContainer":
         super().start()
-        LogMessageWaitStrategy("Running on all addresses").with_startup_timeout(10).wait_until_ready(self)
+        StreamingLogMessageWaitStrategy("Running on all addresses").with_startup_timeout(10).wait_until_ready(self)
         return self
 
     def reset_moto(self) -> None:
@@ -18,6 +18,9 @@ class PostgreSQLContainer(DatabaseContainer):
     - `POSTGRES_USER` - defaults to `username`
     - `POSTGRES_PASSWORD` - defaults to `password`
     - `POSTGRES_DB` - defaults to `db`
+
+    With `in_memory=True`, the data directory (`PGDATA`) is moved to a tmpfs mount limited to `in_memory_size`,
+    and `synchronous_commit` and `full_page_writes` are turned off.
     """
 
     def __init__(
@@ -29,6 +32,8 @@ class PostgreSQLContainer(DatabaseContainer):
         username: str | None = None,
         password: str | None = None,
         database: str | None = None,
+        in_memory: bool = False,
+        in_memory_size: str = "1g",
         disable_logging: bool = False,
         **kwargs: Any,
     ) -> None:
@@ -51,7 +56,70 @@ class PostgreSQLContainer(DatabaseContainer):
 
         # Do not flush data on disk to improve test container performance
         # https://pythonspeed.com/articles/faster-db-tests/
-        self.with_command("-c fsync=off")
+        command = "-c fsync=off"
+        if in_memory:
+            # Data directory is discarded with the container, so crash safety guarantees are not needed
+            command += " -c synchronous_commit=off -c full_page_writes=off"
+            # The default PGDATA differs between image versions and can be a declared volume,
+            # so PGDATA is pointed to a single tmpfs mount of its own to keep the `in_memory_size` limit
+            self.with_tmpfs_mount("/var/lib/postgresql-tmpfs", size=in_memory_size)
+            self.with_env("PGDATA", "/var/lib/postgresql-tmpfs/data")
+        self.with_command(command)
+
+        self._snapshots: set[str] = set()
 
     def log_message_on_container_start(self) -> str:
         return f"PostgreSQL started: {self.get_external_url()}"
+
+    def create_database(self, name: str) -> None:
+        self._execute_sql(
+            f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)',
+            f'CREATE DATABASE "{name}" OWNER "{self.username}"',
+        )
+
+    def drop_database(self, name: str) -> None:
+        self._execute_sql(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+
+    def snapshot(self, name: str = "snapshot") -> None:
+        """Saves the current state of the database as a template database.
+
+        Taking a snapshot terminates open connections to the database,
+        because PostgreSQL can't copy a database that other sessions are connected to.
+        """
+        snapshot_database = self._get_snapshot_database(name)
+        self._execute_sql(
+            f"SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            f"WHERE datname = '{self.database}' AND pid <> pg_backend_pid()",
+            f'DROP DATABASE IF EXISTS "{snapshot_database}"',
+            f'CREATE DATABASE "{snapshot_database}" TEMPLATE "{self.database}"',
+        )
+        self._snapshots.add(self._get_snapshot_database(name))
+
+    def restore(self, name: str = "snapshot") -> None:
+        """Recreates the database from a snapshot taken with `snapshot()`.
+
+        Copying the template database is a file-level copy, so restoring is fast regardless of
+        how many tables the database has. Open connections to the database are terminated.
+        """
+        if not self.has_snapshot(name):
+            raise ValueError(f"Snapshot '{name}' does not exist")
+        self._execute_sql(
+            f'DROP DATABASE IF EXISTS "{self.database}" WITH (FORCE)',
+            f'CREATE DATABASE "{self.database}" TEMPLATE "{self._get_snapshot_database(name)}"',
+        )
+
+    def has_snapshot(self, name: str = "snapshot") -> bool:
+        return self._get_snapshot_database(name) in self._snapshots
+
+    def _get_snapshot_database(self, name: str) -> str:
+        return f"{self.database}_{name}"
+
+    def _execute_sql(self, *statements: str) -> None:
+        # Each statement is passed as a separate -c option, so it's executed in its own transaction;
+        # CREATE DATABASE and DROP DATABASE can't be executed inside a transaction block.
+        command = ["psql", "-v", "ON_ERROR_STOP=1", "-U", self.username, "-d", "postgres"]
+        for statement in statements:
+            command.extend(["-c", statement])
+        exit_code, output = self.exec(command)
+        if exit_code != 0:
+            raise RuntimeError(f"Failed to execute SQL in PostgreSQL container: {output.decode()}")
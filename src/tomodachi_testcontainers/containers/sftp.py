@@ -1,11 +1,9 @@
 from typing import Any, NamedTuple
 
 import asyncssh
-from testcontainers.core.wait_strategies import LogMessageWaitStrategy
-
-from tomodachi_testcontainers.utils import get_available_port
 
 from .common import DockerContainer
+from .common.wait_strategies import StreamingLogMessageWaitStrategy
 
 
 class ConnectionDetails(NamedTuple):
@@ -24,8 +22,7 @@ class SFTPContainer(DockerContainer):
     ) -> None:
         super().__init__(image, disable_logging=disable_logging, **kwargs)
         self.internal_port = internal_port
-        self.edge_port = edge_port or get_available_port()
-        self.with_bind_ports(self.internal_port, self.edge_port)
+        self.edge_port = self._bind_edge_port(self.internal_port, edge_port)
 
         self.with_command("userpass:pass:1001 userssh::1002")
 
@@ -73,7 +70,10 @@ class SFTPContainer(DockerContainer):
 
     def start(self, timeout: float = 10.0) -> "SFTPContainer":
         super().start()
-        LogMessageWaitStrategy(r"Server listening on").with_startup_timeout(int(timeout)).wait_until_ready(self)
+        wait_strategy = StreamingLogMessageWaitStrategy(r"Server listening on").with_startup_timeout(int(timeout))
+        wait_strategy.wait_until_ready(self)
+        if self._reused:  # The directories and the key were set up by the process that started the container
+            return self
 
         self.exec("bash -c 'mkdir /home/userpass/upload && chown -R 1001:1001 /home/userpass/upload'")
         self.exec("bash -c 'mkdir /home/userpass/download && chown -R 1001:1001 /home/userpass/download'")
@@ -83,3 +83,6 @@ class SFTPContainer(DockerContainer):
         self.add_authorized_key(username="userssh", uid="1002", gid="1002", public_key=self.authorized_public_key)
 
         return self
+
+    def _sync_edge_ports(self) -> None:
+        self.edge_port = self._get_host_port(self.internal_port)
@@ -4,11 +4,11 @@ from pathlib import Path
 from typing import Any
 
 import shortuuid
-from testcontainers.core.wait_strategies import LogMessageWaitStrategy
 
 from tomodachi_testcontainers.utils import copy_files_from_container
 
 from .common import WebContainer
+from .common.wait_strategies import StreamingLogMessageWaitStrategy
 
 
 class TomodachiContainer(WebContainer):
@@ -55,7 +55,7 @@ class TomodachiContainer(WebContainer):
         # tomodachi < 0.26.0 - "Started service"
         # tomodachi >= 0.26.0 - "started service successfully"
         # using (?i) to ignore case to support both versions
-        LogMessageWaitStrategy("(?i)started service").with_startup_timeout(10).wait_until_ready(self)
+        StreamingLogMessageWaitStrategy("(?i)started service").with_startup_timeout(10).wait_until_ready(self)
         return self
 
     def stop(self) -> None:
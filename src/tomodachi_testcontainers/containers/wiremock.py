@@ -8,11 +8,10 @@ import os
 from pathlib import Path
 from typing import Any
 
-from testcontainers.core.wait_strategies import LogMessageWaitStrategy
-
 from tomodachi_testcontainers.utils import copy_files_to_container
 
 from .common import WebContainer
+from .common.wait_strategies import StreamingLogMessageWaitStrategy
 
 
 class WireMockContainer(WebContainer):
@@ -53,8 +52,10 @@ class WireMockContainer(WebContainer):
 
     def start(self) -> "WireMockContainer":
         super().start()
-        LogMessageWaitStrategy("port:").with_startup_timeout(10).wait_until_ready(self)
-        self.load_mappings_from_files()
+        StreamingLogMessageWaitStrategy("port:").with_startup_timeout(10).wait_until_ready(self)
+        # An attached container already has the mappings, possibly in use by the process that started it
+        if not self._reused:
+            self.load_mappings_from_files()
         return self
 
     def load_mappings_from_files(self) -> None:
@@ -2,6 +2,7 @@
 
 from contextlib import suppress
 
+from .container_logs import pytest_runtest_makereport, pytest_runtest_setup
 from .containers import testcontainer_image
 from .localstack import (
     localstack_container,
@@ -31,10 +32,10 @@ from .moto import (
 from .wiremock import reset_wiremock_container_on_teardown, wiremock_container
 
 with suppress(ImportError):  # 'mysql' extra dependency
-    from .mysql import mysql_container
+    from .mysql import mysql_container, restore_mysql_container_on_teardown, separate_mysql_database
 
 with suppress(ImportError):  # 'postgres' extra dependency
-    from .postgres import postgres_container
+    from .postgres import postgres_container, restore_postgres_container_on_teardown, separate_postgres_database
 
 with suppress(ImportError):  # 'sftp' extra dependency
     from .sftp import sftp_container, userpass_sftp_client, userssh_sftp_client
@@ -63,9 +64,15 @@ __all__ = [
     "moto_ssm_client",
     "mysql_container",
     "postgres_container",
+    "pytest_runtest_makereport",
+    "pytest_runtest_setup",
     "reset_moto_container_on_teardown",
     "reset_wiremock_container_on_teardown",
     "restart_localstack_container_on_teardown",
+    "restore_mysql_container_on_teardown",
+    "restore_postgres_container_on_teardown",
+    "separate_mysql_database",
+    "separate_postgres_database",
     "sftp_container",
     "testcontainer_image",
     "userpass_sftp_client",
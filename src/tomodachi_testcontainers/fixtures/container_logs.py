@@ -0,0 +1,39 @@
+"""Pytest hooks attaching container logs emitted during a failed test to its report."""
+
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from tomodachi_testcontainers import DockerContainer
+from tomodachi_testcontainers.containers.common.container import get_running_containers
+
+container_log_positions_key = pytest.StashKey[dict[DockerContainer, int]]()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    """Marks the current end of the running containers' logs before the test starts."""
+    item.stash[container_log_positions_key] = {
+        container: container.get_log_buffer().position() for container in get_running_containers()
+    }
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, Any, None]:
+    """Adds the container logs emitted since the test started to the report of a failed test.
+
+    Only the lines kept in the containers' log buffers are attached,
+    so the logs of a very long test are truncated to the most recent lines.
+    Containers started during the test, e.g., by session-scoped fixtures, have all their buffered logs attached.
+    """
+    outcome = yield
+    report: pytest.TestReport = outcome.get_result()
+    if report.failed:
+        positions = item.stash.get(container_log_positions_key, {})
+        for container in get_running_containers():
+            if lines := container.get_log_buffer().lines(since=positions.get(container, 0)):
+                name = f"{container.__class__.__name__} ({container.get_wrapped_container().name})"
+                report.sections.append((f"Captured container logs {report.when}: {name}", "\n".join(lines)))
+    if report.when == "teardown":
+        item.stash[container_log_positions_key] = {}
@@ -1,10 +1,18 @@
 import os
 from collections.abc import Generator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
 
 import pytest
 
-from tomodachi_testcontainers import EphemeralDockerImage
+from tomodachi_testcontainers import DockerContainer, EphemeralDockerImage, SharedDockerContainer
+
+if TYPE_CHECKING:  # 'db' extra dependency
+    from tomodachi_testcontainers import DatabaseContainer
+
+ContainerType = TypeVar("ContainerType", bound=DockerContainer)
+DatabaseContainerType = TypeVar("DatabaseContainerType", bound="DatabaseContainer")
 
 
 @pytest.fixture(scope="session")
@@ -19,6 +27,8 @@ def testcontainer_image() -> Generator[str, None, None]:
     - `TESTCONTAINER_DOCKERFILE_PATH` - override path to the Dockerfile for building Docker image.
     - `TESTCONTAINER_DOCKER_BUILD_CONTEXT` - override Docker build context.
     - `TESTCONTAINER_DOCKER_BUILD_TARGET` - override Docker build target.
+    - `TESTCONTAINER_DOCKER_BUILD_CACHE` - skip the build if the Dockerfile and build context haven't changed
+      since the last build; the cached image is not removed on test session end.
     """
     if image_id := os.getenv("TESTCONTAINER_IMAGE_ID"):
         yield image_id
@@ -30,5 +40,41 @@ def testcontainer_image() -> Generator[str, None, None]:
             # Don't remove the image on teardown if it's used by other pytest-xdist workers in parallel.
             # The image will be eventually removed by the 'master' worker that exits last.
             remove_image_on_exit=not os.getenv("PYTEST_XDIST_WORKER"),
+            cache=bool(os.getenv("TESTCONTAINER_DOCKER_BUILD_CACHE")),
         ) as image:
             yield str(image.id)
+
+
+@contextmanager
+def share_between_xdist_workers(
+    container: ContainerType, tmp_path_factory: pytest.TempPathFactory, *, enabled: bool = True
+) -> Generator[ContainerType, None, None]:
+    """Shares the container between pytest-xdist workers when running tests in parallel.
+
+    One worker starts the container, other workers attach to it, and the last worker to finish removes it.
+    Workers coordinate through a file lock and a state file in the pytest-xdist base temporary directory.
+    Without pytest-xdist, or when `enabled` is `False`, the container is started as usual.
+    """
+    if not enabled or not os.getenv("PYTEST_XDIST_WORKER"):
+        with container:
+            yield container
+        return
+    with SharedDockerContainer(container, state_dir=tmp_path_factory.getbasetemp().parent):
+        yield container
+
+
+@contextmanager
+def separate_database_per_xdist_worker(
+    container: DatabaseContainerType, *, enabled: bool = True
+) -> Generator[DatabaseContainerType, None, None]:
+    """Creates a separate database for each pytest-xdist worker on a database server shared between the workers.
+
+    The container URLs point to the worker's database, e.g., `db_gw0`, until the context manager exits.
+    Without pytest-xdist, or when `enabled` is `False`, the container's default database is used.
+    """
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    if not enabled or not worker_id:
+        yield container
+        return
+    with container.separate_database(f"{container.database}_{worker_id}"):
+        yield container
@@ -7,14 +7,19 @@ from aiobotocore.session import get_session
 from types_aiobotocore_s3 import S3Client
 
 from tomodachi_testcontainers import DockerContainer, MinioContainer
+from tomodachi_testcontainers.fixtures.containers import share_between_xdist_workers
 
 
 @pytest.fixture(scope="session")
-def minio_container() -> Generator[DockerContainer, None, None]:
+def minio_container(tmp_path_factory: pytest.TempPathFactory) -> Generator[DockerContainer, None, None]:
     image = os.getenv("MINIO_TESTCONTAINER_IMAGE_ID", "minio/minio:latest")
     disable_logging = bool(os.getenv("MINIO_TESTCONTAINER_DISABLE_LOGGING")) or False
+    reuse = bool(os.getenv("MINIO_TESTCONTAINER_REUSE")) or False
+    xdist_share = bool(os.getenv("MINIO_TESTCONTAINER_XDIST_SHARE")) or False
 
-    with MinioContainer(image, disable_logging=disable_logging) as container:
+    with share_between_xdist_workers(
+        MinioContainer(image, disable_logging=disable_logging, reuse=reuse), tmp_path_factory, enabled=xdist_share
+    ) as container:
         yield container
 
 
@@ -14,14 +14,19 @@ from types_aiobotocore_ssm import SSMClient
 
 from tomodachi_testcontainers import DockerContainer, MotoContainer
 from tomodachi_testcontainers.clients.snssqs import SNSSQSTestClient
+from tomodachi_testcontainers.fixtures.containers import share_between_xdist_workers
 
 
 @pytest.fixture(scope="session")
-def moto_container() -> Generator[DockerContainer, None, None]:
+def moto_container(tmp_path_factory: pytest.TempPathFactory) -> Generator[DockerContainer, None, None]:
     image = os.getenv("MOTO_TESTCONTAINER_IMAGE_ID", "motoserver/moto:latest")
     disable_logging = bool(os.getenv("MOTO_TESTCONTAINER_DISABLE_LOGGING")) or False
+    reuse = bool(os.getenv("MOTO_TESTCONTAINER_REUSE")) or False
+    xdist_share = bool(os.getenv("MOTO_TESTCONTAINER_XDIST_SHARE")) or False
 
-    with MotoContainer(image, disable_logging=disable_logging) as container:
+    with share_between_xdist_workers(
+        MotoContainer(image, disable_logging=disable_logging, reuse=reuse), tmp_path_factory, enabled=xdist_share
+    ) as container:
         yield container
 
 
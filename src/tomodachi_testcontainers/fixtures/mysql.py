@@ -1,15 +1,54 @@
 import os
+import uuid
 from collections.abc import Generator
 
 import pytest
 
 from tomodachi_testcontainers import DockerContainer, MySQLContainer
+from tomodachi_testcontainers.fixtures.containers import (
+    separate_database_per_xdist_worker,
+    share_between_xdist_workers,
+)
 
 
 @pytest.fixture(scope="session")
-def mysql_container() -> Generator[DockerContainer, None, None]:
+def mysql_container(tmp_path_factory: pytest.TempPathFactory) -> Generator[DockerContainer, None, None]:
     image = os.getenv("MYSQL_TESTCONTAINER_IMAGE_ID", "mysql:9")
     disable_logging = bool(os.getenv("MYSQL_TESTCONTAINER_DISABLE_LOGGING")) or False
+    reuse = bool(os.getenv("MYSQL_TESTCONTAINER_REUSE")) or False
+    xdist_share = bool(os.getenv("MYSQL_TESTCONTAINER_XDIST_SHARE")) or False
+    in_memory = bool(os.getenv("MYSQL_TESTCONTAINER_IN_MEMORY")) or False
 
-    with MySQLContainer(image, disable_logging=disable_logging) as container:
+    with (
+        share_between_xdist_workers(
+            MySQLContainer(image, in_memory=in_memory, disable_logging=disable_logging, reuse=reuse),
+            tmp_path_factory,
+            enabled=xdist_share,
+        ) as container,
+        separate_database_per_xdist_worker(container, enabled=xdist_share),
+    ):
         yield container
+
+
+@pytest.fixture
+def restore_mysql_container_on_teardown(mysql_container: MySQLContainer) -> Generator[None, None, None]:
+    """Restores the MySQL database after each test to the state it had when the fixture was first used.
+
+    The snapshot is taken on the first use of the fixture, so run database migrations before that,
+    e.g., in a session-scoped fixture.
+    """
+    if not mysql_container.has_snapshot():
+        mysql_container.snapshot()
+    yield
+    mysql_container.restore()
+
+
+@pytest.fixture
+def separate_mysql_database(mysql_container: MySQLContainer) -> Generator[MySQLContainer, None, None]:
+    """Creates a separate database for a single test on the shared mysql_container server.
+
+    The database is created empty, so run the migrations in the test setup.
+    The container URLs point to the test's database until the test finishes, and the database is dropped afterwards.
+    """
+    with mysql_container.separate_database(f"{mysql_container.database}_{uuid.uuid4().hex[:8]}"):
+        yield mysql_container
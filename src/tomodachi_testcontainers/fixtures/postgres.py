@@ -1,15 +1,54 @@
 import os
+import uuid
 from collections.abc import Generator
 
 import pytest
 
 from tomodachi_testcontainers import DockerContainer, PostgreSQLContainer
+from tomodachi_testcontainers.fixtures.containers import (
+    separate_database_per_xdist_worker,
+    share_between_xdist_workers,
+)
 
 
 @pytest.fixture(scope="session")
-def postgres_container() -> Generator[DockerContainer, None, None]:
+def postgres_container(tmp_path_factory: pytest.TempPathFactory) -> Generator[DockerContainer, None, None]:
     image = os.getenv("POSTGRES_TESTCONTAINER_IMAGE_ID", "postgres:18")
     disable_logging = bool(os.getenv("POSTGRES_TESTCONTAINER_DISABLE_LOGGING")) or False
+    reuse = bool(os.getenv("POSTGRES_TESTCONTAINER_REUSE")) or False
+    xdist_share = bool(os.getenv("POSTGRES_TESTCONTAINER_XDIST_SHARE")) or False
+    in_memory = bool(os.getenv("POSTGRES_TESTCONTAINER_IN_MEMORY")) or False
 
-    with PostgreSQLContainer(image, disable_logging=disable_logging) as container:
+    with (
+        share_between_xdist_workers(
+            PostgreSQLContainer(image, in_memory=in_memory, disable_logging=disable_logging, reuse=reuse),
+            tmp_path_factory,
+            enabled=xdist_share,
+        ) as container,
+        separate_database_per_xdist_worker(container, enabled=xdist_share),
+    ):
         yield container
+
+
+@pytest.fixture
+def restore_postgres_container_on_teardown(postgres_container: PostgreSQLContainer) -> Generator[None, None, None]:
+    """Restores the PostgreSQL database after each test to the state it had when the fixture was first used.
+
+    The snapshot is taken on the first use of the fixture, so run database migrations before that,
+    e.g., in a session-scoped fixture.
+    """
+    if not postgres_container.has_snapshot():
+        postgres_container.snapshot()
+    yield
+    postgres_container.restore()
+
+
+@pytest.fixture
+def separate_postgres_database(postgres_container: PostgreSQLContainer) -> Generator[PostgreSQLContainer, None, None]:
+    """Creates a separate database for a single test on the shared postgres_container server.
+
+    The database is created empty, so run the migrations in the test setup.
+    The container URLs point to the test's database until the test finishes, and the database is dropped afterwards.
+    """
+    with postgres_container.separate_database(f"{postgres_container.database}_{uuid.uuid4().hex[:8]}"):
+        yield postgres_container
@@ -6,14 +6,19 @@ import pytest
 import pytest_asyncio
 
 from tomodachi_testcontainers import DockerContainer, SFTPContainer
+from tomodachi_testcontainers.fixtures.containers import share_between_xdist_workers
 
 
 @pytest.fixture(scope="session")
-def sftp_container() -> Generator[DockerContainer, None, None]:
+def sftp_container(tmp_path_factory: pytest.TempPathFactory) -> Generator[DockerContainer, None, None]:
     image = os.getenv("SFTP_TESTCONTAINER_IMAGE_ID", "atmoz/sftp:latest")
     disable_logging = bool(os.getenv("SFTP_TESTCONTAINER_DISABLE_LOGGING")) or False
+    reuse = bool(os.getenv("SFTP_TESTCONTAINER_REUSE")) or False
+    xdist_share = bool(os.getenv("SFTP_TESTCONTAINER_XDIST_SHARE")) or False
 
-    with SFTPContainer(image, disable_logging=disable_logging) as container:
+    with share_between_xdist_workers(
+        SFTPContainer(image, disable_logging=disable_logging, reuse=reuse), tmp_path_factory, enabled=xdist_share
+    ) as container:
         yield container
 
 
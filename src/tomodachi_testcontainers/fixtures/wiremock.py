@@ -5,6 +5,7 @@ from typing import cast
 import pytest
 
 from tomodachi_testcontainers import WireMockContainer
+from tomodachi_testcontainers.fixtures.containers import share_between_xdist_workers
 
 try:
     from wiremock.constants import Config as WireMockConfig
@@ -13,11 +14,15 @@ except ImportError:
 
 
 @pytest.fixture(scope="session")
-def wiremock_container() -> Generator[WireMockContainer, None, None]:
+def wiremock_container(tmp_path_factory: pytest.TempPathFactory) -> Generator[WireMockContainer, None, None]:
     image = os.getenv("WIREMOCK_TESTCONTAINER_IMAGE_ID", "wiremock/wiremock:latest")
     disable_logging = bool(os.getenv("WIREMOCK_TESTCONTAINER_DISABLE_LOGGING")) or False
+    reuse = bool(os.getenv("WIREMOCK_TESTCONTAINER_REUSE")) or False
+    xdist_share = bool(os.getenv("WIREMOCK_TESTCONTAINER_XDIST_SHARE")) or False
 
-    with WireMockContainer(image, disable_logging=disable_logging) as container:
+    with share_between_xdist_workers(
+        WireMockContainer(image, disable_logging=disable_logging, reuse=reuse), tmp_path_factory, enabled=xdist_share
+    ) as container:
         container = cast("WireMockContainer", container)
         if WireMockConfig is not None:
             WireMockConfig.base_url = f"{container.get_external_url()}/__admin/"
@@ -1,16 +1,23 @@
 import io
 import logging
 import os
+import queue
 import socket
 import tarfile
+import threading
+from collections.abc import Iterator
+from contextlib import suppress
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import IO, TypedDict, cast
 
 from docker.errors import ImageNotFound
 from docker.models.containers import Container
 from docker.models.images import Image
 from testcontainers.core.docker_client import DockerClient
 
+_TAR_STREAM_CHUNK_SIZE = 64 * 1024
+_TAR_STREAM_MAX_BUFFERED_CHUNKS = 16
+
 
 class AWSClientConfig(TypedDict):
     region_name: str
@@ -28,20 +35,89 @@ def get_docker_image(image_id: str, docker_client_kwargs: dict | None = None) ->
         return cast("Image", client.client.images.pull(image_id))
 
 
-def copy_files_to_container(container: Container, host_path: Path, container_path: Path) -> None:
-    """Copies a folder or a file from the host to the container."""
-    tar_stream = io.BytesIO()
-    with tarfile.open(fileobj=tar_stream, mode="w") as tar:
-        if host_path.is_dir():
-            for root, _, files in os.walk(host_path):
-                for file in files:
-                    file_path = Path(root) / file
-                    arcname = os.path.relpath(file_path, host_path)
-                    tar.add(file_path, arcname=arcname)
+def copy_files_to_container(
+    container: Container, host_path: Path, container_path: Path, compress: bool = False
+) -> None:
+    """Copies a folder or a file from the host to the container.
+
+    The tar archive is streamed to the container as it's created - files are read and archived on a background thread
+    while the already archived chunks are being uploaded, so memory usage doesn't depend on the size of the files.
+    Set `compress=True` to gzip the archive, e.g., when copying large text files to a remote Docker host.
+    """
+    container.put_archive(path=container_path, data=_stream_tar_archive(host_path, compress=compress))
+
+
+def _stream_tar_archive(host_path: Path, compress: bool = False) -> Iterator[bytes]:
+    """Yields chunks of a tar archive of a folder or a file, holding at most a few archive chunks in memory."""
+    chunks: queue.Queue[bytes | BaseException | None] = queue.Queue(maxsize=_TAR_STREAM_MAX_BUFFERED_CHUNKS)
+    cancelled = threading.Event()
+
+    def _write_tar_archive() -> None:
+        writer = _TarChunkWriter(chunks, cancelled)
+        try:
+            with tarfile.open(fileobj=cast("IO[bytes]", writer), mode="w|gz" if compress else "w|") as tar:
+                _add_to_tar_archive(tar, host_path)
+            writer.flush()
+        except _TarStreamCancelledError:
+            return
+        except BaseException as e:
+            _put_chunk(chunks, e, cancelled)
         else:
-            tar.add(host_path, arcname=host_path.name)
-    tar_stream.seek(0)
-    container.put_archive(path=container_path, data=tar_stream)
+            _put_chunk(chunks, None, cancelled)
+
+    threading.Thread(target=_write_tar_archive, name="testcontainers-tar-writer", daemon=True).start()
+    try:
+        while (chunk := chunks.get()) is not None:
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield chunk
+    finally:
+        cancelled.set()
+
+
+def _add_to_tar_archive(tar: tarfile.TarFile, host_path: Path) -> None:
+    if host_path.is_dir():
+        for root, _, files in os.walk(host_path):
+            for file in files:
+                file_path = Path(root) / file
+                arcname = os.path.relpath(file_path, host_path)
+                tar.add(file_path, arcname=arcname)
+    else:
+        tar.add(host_path, arcname=host_path.name)
+
+
+class _TarStreamCancelledError(Exception):
+    pass
+
+
+class _TarChunkWriter:
+    """Collects tar archive writes into chunks of `_TAR_STREAM_CHUNK_SIZE` bytes and puts them on a bounded queue."""
+
+    def __init__(self, chunks: "queue.Queue[bytes | BaseException | None]", cancelled: threading.Event) -> None:
+        self._chunks = chunks
+        self._cancelled = cancelled
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> None:
+        self._buffer += data
+        if len(self._buffer) >= _TAR_STREAM_CHUNK_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            _put_chunk(self._chunks, bytes(self._buffer), self._cancelled)
+            self._buffer.clear()
+
+
+def _put_chunk(
+    chunks: "queue.Queue[bytes | BaseException | None]", chunk: bytes | BaseException | None, cancelled: threading.Event
+) -> None:
+    """Waits for space in the queue, so that reading files doesn't get ahead of the upload."""
+    while not cancelled.is_set():
+        with suppress(queue.Full):
+            chunks.put(chunk, timeout=0.1)
+            return
+    raise _TarStreamCancelledError
 
 
 def copy_files_from_container(container: Container, container_path: Path, host_path: Path) -> None:
@@ -1,5 +1,8 @@
+import asyncio
 import json
 import re
+from contextlib import aclosing
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from types_aiobotocore_sns import SNSClient
@@ -7,7 +10,13 @@ from types_aiobotocore_sqs import SQSClient
 
 from tests.envelopes import JsonBase, ProtobufBase
 from tomodachi_testcontainers.clients import SNSSQSTestClient
-from tomodachi_testcontainers.clients.snssqs import QueueDoesNotExistError, SQSMessage, TopicDoesNotExistError
+from tomodachi_testcontainers.clients.snssqs import (
+    BatchEntriesFailedError,
+    FailedBatchEntry,
+    QueueDoesNotExistError,
+    SQSMessage,
+    TopicDoesNotExistError,
+)
 
 from .proto.person_pb2 import Person
 
@@ -246,3 +255,283 @@ async def test_topic_attribute_getters__raise_when_topic_does_not_exist(snssqs_t
 
     with pytest.raises(TopicDoesNotExistError, match="topic"):
         await snssqs_test_client.get_topic_attributes("topic")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_topic_arn_matches_exact_topic_name(
+    snssqs_test_client: SNSSQSTestClient, moto_sns_client: SNSClient, moto_sqs_client: SQSClient
+) -> None:
+    await snssqs_test_client.create_topic("my-topic")
+    await snssqs_test_client.create_topic("topic")
+
+    topic_arn = await SNSSQSTestClient(moto_sns_client, moto_sqs_client).get_topic_arn("topic")
+
+    assert topic_arn == "arn:aws:sns:us-east-1:123456789012:topic"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_topic_arn_and_queue_url_are_cached(
+    snssqs_test_client: SNSSQSTestClient, moto_sns_client: SNSClient, moto_sqs_client: SQSClient
+) -> None:
+    await snssqs_test_client.subscribe_to(topic="topic", queue="queue")
+    snssqs_test_client = SNSSQSTestClient(moto_sns_client, moto_sqs_client)
+
+    with (
+        patch.object(moto_sns_client, "get_paginator", wraps=moto_sns_client.get_paginator) as get_paginator,
+        patch.object(moto_sqs_client, "get_queue_url", wraps=moto_sqs_client.get_queue_url) as get_queue_url,
+    ):
+        for _ in range(3):
+            await snssqs_test_client.publish("topic", {"message": "1"}, JsonBase)
+            await snssqs_test_client.send("queue", {"message": "2"}, JsonBase)
+
+    assert get_paginator.call_count == 1
+    assert get_queue_url.call_count == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cached_queue_url_invalidated_when_queue_does_not_exist(
+    snssqs_test_client: SNSSQSTestClient, moto_sqs_client: SQSClient
+) -> None:
+    await snssqs_test_client.create_queue("queue")
+    queue_url = await snssqs_test_client.get_queue_url("queue")
+    await moto_sqs_client.delete_queue(QueueUrl=queue_url)
+
+    with pytest.raises(QueueDoesNotExistError, match="queue"):
+        await snssqs_test_client.send("queue", {"message": "1"}, JsonBase)
+    with pytest.raises(QueueDoesNotExistError, match="queue"):
+        await snssqs_test_client.get_queue_url("queue")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_delete_topic_and_queue(snssqs_test_client: SNSSQSTestClient) -> None:
+    await snssqs_test_client.subscribe_to(topic="topic", queue="queue")
+
+    await snssqs_test_client.delete_topic("topic")
+    await snssqs_test_client.delete_queue("queue")
+
+    with pytest.raises(TopicDoesNotExistError, match="topic"):
+        await snssqs_test_client.get_topic_arn("topic")
+    with pytest.raises(QueueDoesNotExistError, match="queue"):
+        await snssqs_test_client.get_queue_url("queue")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_publish_batch(snssqs_test_client: SNSSQSTestClient) -> None:
+    await snssqs_test_client.subscribe_to(topic="topic", queue="queue")
+
+    await snssqs_test_client.publish_batch("topic", ({"message": str(i)} for i in range(25)), JsonBase)
+
+    messages = await _receive_all(snssqs_test_client, "queue")
+    assert sorted(int(v.payload["message"]) for v in messages) == list(range(25))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_publish_batch_to_fifo_topic(snssqs_test_client: SNSSQSTestClient) -> None:
+    await snssqs_test_client.subscribe_to(topic="topic.fifo", queue="queue.fifo")
+
+    await snssqs_test_client.publish_batch(
+        "topic.fifo", [{"message": "1"}, {"message": "1"}], JsonBase, message_group_id="123456"
+    )
+
+    messages = await _receive_all(snssqs_test_client, "queue.fifo")
+    assert messages == [SQSMessage({"message": "1"}), SQSMessage({"message": "1"})]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_send_batch(snssqs_test_client: SNSSQSTestClient) -> None:
+    await snssqs_test_client.create_queue("queue")
+
+    await snssqs_test_client.send_batch(
+        "queue",
+        ({"message": str(i)} for i in range(25)),
+        JsonBase,
+        message_attributes={"MyMessageAttribute": {"DataType": "String", "StringValue": "test-value"}},
+    )
+
+    messages = await _receive_all(snssqs_test_client, "queue")
+    assert sorted(int(v.payload["message"]) for v in messages) == list(range(25))
+    assert messages[0].message_attributes == {"MyMessageAttribute": {"DataType": "String", "StringValue": "test-value"}}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_send_batch_reports_failed_entries() -> None:
+    sqs_client = AsyncMock()
+    sqs_client.get_queue_url.return_value = {"QueueUrl": "http://localhost/123456789012/queue"}
+    sqs_client.send_message_batch.side_effect = [
+        {"Successful": [], "Failed": [{"Id": "3", "Code": "InternalError", "Message": "Error", "SenderFault": False}]},
+        {"Successful": [], "Failed": [{"Id": "12", "Code": "InvalidMessage", "SenderFault": True}]},
+    ]
+    snssqs_test_client = SNSSQSTestClient(AsyncMock(), sqs_client)
+
+    with pytest.raises(BatchEntriesFailedError) as exc_info:
+        await snssqs_test_client.send_batch("queue", ({"message": str(i)} for i in range(15)), JsonBase)
+
+    assert sqs_client.send_message_batch.await_count == 2
+    assert exc_info.value.failed_entries == [
+        FailedBatchEntry(index=3, code="InternalError", message="Error", sender_fault=False),
+        FailedBatchEntry(index=12, code="InvalidMessage", message="", sender_fault=True),
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_receive_with_long_polling_waits_for_messages(snssqs_test_client: SNSSQSTestClient) -> None:
+    await snssqs_test_client.create_queue("queue")
+
+    async def _send_later() -> None:
+        await asyncio.sleep(0.5)
+        await snssqs_test_client.send("queue", {"message": "1"}, JsonBase)
+
+    send_task = asyncio.create_task(_send_later())
+    messages = await snssqs_test_client.receive("queue", JsonBase, dict[str, str], wait_time_seconds=5)
+    await send_task
+
+    assert messages == [SQSMessage({"message": "1"})]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_receive_until_count_messages_received(snssqs_test_client: SNSSQSTestClient) -> None:
+    await snssqs_test_client.create_queue("queue")
+    await snssqs_test_client.send_batch("queue", ({"message": str(i)} for i in range(25)), JsonBase)
+
+    messages = await snssqs_test_client.receive_until("queue", JsonBase, dict[str, str], count=25)
+
+    assert sorted(int(v.payload["message"]) for v in messages) == list(range(25))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_receive_until_raises_timeout_error(snssqs_test_client: SNSSQSTestClient) -> None:
+    await snssqs_test_client.create_queue("queue")
+    await snssqs_test_client.send("queue", {"message": "1"}, JsonBase)
+
+    with pytest.raises(TimeoutError, match="Received 1 of 2 messages from 'queue' within 1.0 seconds"):
+        await snssqs_test_client.receive_until("queue", JsonBase, dict[str, str], count=2, stop_after=1.0)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_messages(snssqs_test_client: SNSSQSTestClient) -> None:
+    await snssqs_test_client.create_queue("queue")
+    await snssqs_test_client.send_batch("queue", ({"message": str(i)} for i in range(55)), JsonBase)
+
+    messages = [
+        message
+        async for message in snssqs_test_client.stream(
+            "queue", JsonBase, dict[str, str], buffer_size=10, stop_after_idle=1.0
+        )
+    ]
+
+    assert sorted(int(v.payload["message"]) for v in messages) == list(range(55))
+    assert await _count_messages_in_queue(snssqs_test_client, "queue") == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_deletes_only_consumed_messages(snssqs_test_client: SNSSQSTestClient) -> None:
+    await snssqs_test_client.create_queue("queue")
+    await snssqs_test_client.send_batch("queue", ({"message": str(i)} for i in range(25)), JsonBase)
+
+    async with aclosing(snssqs_test_client.stream("queue", JsonBase, dict[str, str])) as stream:
+        consumed_messages: list[SQSMessage[dict[str, str]]] = []
+        async for message in stream:
+            consumed_messages.append(message)
+            if len(consumed_messages) == 5:
+                break
+
+    assert len(consumed_messages) == 5
+    assert await _count_messages_in_queue(snssqs_test_client, "queue") == 20
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_extends_visibility_timeout_of_received_messages() -> None:
+    received_messages = [
+        {
+            "ReceiptHandle": f"receipt-handle-{i}",
+            "Body": json.dumps({"Message": await JsonBase.build_message({}, "", i)}),
+        }
+        for i in range(2)
+    ]
+
+    async def _receive_message(**_: object) -> dict:
+        if received_messages:
+            return {"Messages": [received_messages.pop(0)]}
+        await asyncio.sleep(10)
+        return {}
+
+    sqs_client = AsyncMock()
+    sqs_client.get_queue_url.return_value = {"QueueUrl": "http://localhost/123456789012/queue"}
+    sqs_client.receive_message.side_effect = _receive_message
+    sqs_client.change_message_visibility_batch.return_value = {"Successful": [], "Failed": []}
+    sqs_client.delete_message_batch.return_value = {"Successful": [], "Failed": []}
+    snssqs_test_client = SNSSQSTestClient(AsyncMock(), sqs_client)
+
+    async with aclosing(snssqs_test_client.stream("queue", JsonBase, int, receivers=1, visibility_timeout=1)) as stream:
+        async for _ in stream:
+            await asyncio.sleep(0.75)  # Slow consumer outlasting half of the visibility timeout
+            break
+
+    assert sqs_client.receive_message.await_args.kwargs["VisibilityTimeout"] == 1
+    sqs_client.change_message_visibility_batch.assert_awaited_with(
+        QueueUrl="http://localhost/123456789012/queue",
+        Entries=[
+            {"Id": "0", "ReceiptHandle": "receipt-handle-0", "VisibilityTimeout": 1},
+            {"Id": "1", "ReceiptHandle": "receipt-handle-1", "VisibilityTimeout": 1},
+        ],
+    )
+    sqs_client.delete_message_batch.assert_awaited_once_with(
+        QueueUrl="http://localhost/123456789012/queue", Entries=[{"Id": "0", "ReceiptHandle": "receipt-handle-0"}]
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_receive_reports_messages_failed_to_delete() -> None:
+    sqs_client = AsyncMock()
+    sqs_client.get_queue_url.return_value = {"QueueUrl": "http://localhost/123456789012/queue"}
+    sqs_client.receive_message.return_value = {
+        "Messages": [
+            {
+                "ReceiptHandle": "receipt-handle",
+                "Body": json.dumps({"Message": await JsonBase.build_message({}, "", 1)}),
+            }
+        ]
+    }
+    sqs_client.delete_message_batch.return_value = {
+        "Successful": [],
+        "Failed": [{"Id": "0", "Code": "ReceiptHandleIsInvalid", "SenderFault": True}],
+    }
+    snssqs_test_client = SNSSQSTestClient(AsyncMock(), sqs_client)
+
+    with pytest.raises(BatchEntriesFailedError) as exc_info:
+        await snssqs_test_client.receive("queue", JsonBase, int)
+
+    assert exc_info.value.failed_entries == [
+        FailedBatchEntry(index=0, code="ReceiptHandleIsInvalid", message="", sender_fault=True)
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_receive_protobuf_messages_decoded_in_thread_pool(
+    moto_sns_client: SNSClient, moto_sqs_client: SQSClient
+) -> None:
+    snssqs_test_client = SNSSQSTestClient(moto_sns_client, moto_sqs_client, decode_protobuf_in_thread_pool=True)
+    await snssqs_test_client.subscribe_to(topic="topic", queue="queue")
+    await snssqs_test_client.publish_batch(
+        "topic", (Person(id=str(i), name="John Doe") for i in range(10)), ProtobufBase
+    )
+
+    messages = await snssqs_test_client.receive_until("queue", ProtobufBase, Person, count=10)
+
+    assert sorted(int(v.payload.id) for v in messages) == list(range(10))
+
+
+async def _count_messages_in_queue(snssqs_test_client: SNSSQSTestClient, queue: str) -> int:
+    queue_attributes = await snssqs_test_client.get_queue_attributes(
+        queue, attributes=["ApproximateNumberOfMessages", "ApproximateNumberOfMessagesNotVisible"]
+    )
+    return int(queue_attributes["ApproximateNumberOfMessages"]) + int(
+        queue_attributes["ApproximateNumberOfMessagesNotVisible"]
+    )
+
+
+async def _receive_all(snssqs_test_client: SNSSQSTestClient, queue: str) -> list[SQSMessage[dict[str, str]]]:
+    messages: list[SQSMessage[dict[str, str]]] = []
+    while received_messages := await snssqs_test_client.receive(queue, JsonBase, dict[str, str]):
+        messages.extend(received_messages)
+    return messages
@@ -0,0 +1,44 @@
+from tomodachi_testcontainers.containers.common.logs import ContainerLogBuffer
+
+
+def test_lines_since_position() -> None:
+    buffer = ContainerLogBuffer()
+
+    buffer.append("line 1")
+    position = buffer.position()
+    buffer.append("line 2")
+    buffer.append("line 3")
+
+    assert position == 1
+    assert buffer.position() == 3
+    assert buffer.lines() == ["line 1", "line 2", "line 3"]
+    assert buffer.lines(since=position) == ["line 2", "line 3"]
+    assert buffer.lines(since=buffer.position()) == []
+
+
+def test_oldest_lines_discarded_when_buffer_is_full() -> None:
+    buffer = ContainerLogBuffer(max_bytes=12)
+
+    for i in range(5):
+        buffer.append(f"line {i}")
+
+    assert buffer.lines() == ["line 3", "line 4"]
+    assert buffer.lines(since=1) == ["line 3", "line 4"]
+    assert buffer.lines(since=4) == ["line 4"]
+    assert buffer.position() == 5
+
+
+def test_line_longer_than_buffer_is_truncated() -> None:
+    buffer = ContainerLogBuffer(max_bytes=4)
+
+    buffer.append("long line")
+
+    assert buffer.lines() == ["long"]
+
+
+def test_multibyte_characters_stored_as_utf8() -> None:
+    buffer = ContainerLogBuffer()
+
+    buffer.append("Sveiki, pasaulē!")
+
+    assert buffer.lines() == ["Sveiki, pasaulē!"]
@@ -0,0 +1,41 @@
+from tomodachi_testcontainers.containers.common.logs import ContainerLogBuffer, ContainerLogCursor
+
+
+def test_reads_only_new_lines() -> None:
+    buffer = ContainerLogBuffer()
+    cursor = ContainerLogCursor(buffer)
+
+    buffer.append("line 1")
+    buffer.append("line 2")
+    assert cursor.read() == ["line 1", "line 2"]
+
+    buffer.append("line 3")
+    assert cursor.read() == ["line 3"]
+    assert cursor.read() == []
+
+    assert cursor.lines() == ["line 1", "line 2", "line 3"]
+
+
+def test_lines_since_position() -> None:
+    buffer = ContainerLogBuffer()
+    cursor = ContainerLogCursor(buffer)
+
+    buffer.append("line 1")
+    position = cursor.position()
+    buffer.append("line 2")
+
+    assert position == 1
+    assert cursor.lines(since=position) == ["line 2"]
+
+
+def test_lines_discarded_from_buffer_are_skipped() -> None:
+    buffer = ContainerLogBuffer(max_bytes=12)
+    cursor = ContainerLogCursor(buffer)
+
+    buffer.append("line 1")
+    assert cursor.read() == ["line 1"]
+    for i in range(2, 5):
+        buffer.append(f"line {i}")
+
+    assert cursor.read() == ["line 3", "line 4"]
+    assert cursor.position() == 4
@@ -0,0 +1,135 @@
+import logging
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from tomodachi_testcontainers.containers.common.logs import ContainerLogBuffer, ContainerLogForwarder
+
+LOGGER_NAME = "test-container-log-forwarder"
+
+
+class FakeLogStream:
+    def __init__(self, chunks: list[bytes], *, follow: bool = False) -> None:
+        self._chunks = chunks
+        self._follow = follow
+        self._closed = threading.Event()
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._chunks
+        if self._follow:
+            self._closed.wait()
+            raise ConnectionError("Stream closed")
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+class FakeContainer:
+    def __init__(self, stream: FakeLogStream) -> None:
+        self.stream = stream
+        self.logs_kwargs: dict[str, Any] = {}
+
+    def logs(self, **kwargs: Any) -> FakeLogStream:
+        self.logs_kwargs = kwargs
+        return self.stream
+
+
+def forward_logs(chunks: list[bytes], caplog: pytest.LogCaptureFixture, **kwargs: Any) -> list[logging.LogRecord]:
+    forwarder = ContainerLogForwarder(
+        FakeContainer(FakeLogStream(chunks)),  # type: ignore[arg-type]
+        logging.getLogger(LOGGER_NAME),
+        **kwargs,
+    )
+    with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+        forwarder.start()
+        forwarder.stop(timeout=None)
+    return [record for record in caplog.records if record.name == LOGGER_NAME]
+
+
+def test_log_lines_forwarded(caplog: pytest.LogCaptureFixture) -> None:
+    records = forward_logs([b"line 1\nli", b"ne 2\n", b"line 3"], caplog)
+
+    assert [record.getMessage() for record in records] == ["line 1", "line 2", "line 3"]
+    assert {record.levelno for record in records} == {logging.INFO}
+
+
+def test_multibyte_character_split_between_chunks(caplog: pytest.LogCaptureFixture) -> None:
+    message = "Sveiki, pasaulē!\n".encode()
+
+    records = forward_logs([message[:15], message[15:]], caplog)
+
+    assert [record.getMessage() for record in records] == ["Sveiki, pasaulē!"]
+
+
+def test_long_lines_are_split(caplog: pytest.LogCaptureFixture) -> None:
+    records = forward_logs([b"a" * 10, b"b" * 5 + b"\n"], caplog, max_line_length=4)
+
+    assert [record.getMessage() for record in records] == ["aaaa", "aaaa", "aabb", "bbb"]
+
+
+@pytest.mark.parametrize(
+    ("line", "level"),
+    [
+        ('{"level": "error", "message": "Something failed"}', logging.ERROR),
+        ('{"levelname": "WARNING", "message": "Something is off"}', logging.WARNING),
+        ('{"severity": "DEBUG", "message": "Details"}', logging.DEBUG),
+        ('{"log.level": "fatal", "message": "Giving up"}', logging.CRITICAL),
+        ('{"message": "No level"}', logging.INFO),
+        ("2024-01-01T12:00:00.000000Z [warning  ] Something is off", logging.WARNING),
+        ("2024-01-01T12:00:00.000000Z [\x1b[31m\x1b[1merror    \x1b[0m] Something failed", logging.ERROR),
+        ("Plain log line", logging.INFO),
+        ("{not a JSON line", logging.INFO),
+    ],
+)
+def test_log_level_mapped_from_log_line(line: str, level: int, caplog: pytest.LogCaptureFixture) -> None:
+    records = forward_logs([f"{line}\n".encode()], caplog)
+
+    assert [record.levelno for record in records] == [level]
+
+
+def test_excess_log_lines_dropped_by_rate_limit(caplog: pytest.LogCaptureFixture) -> None:
+    records = forward_logs([f"line {i}\n".encode() for i in range(10)], caplog, max_lines_per_second=3)
+
+    assert [record.getMessage() for record in records] == [
+        "line 0",
+        "line 1",
+        "line 2",
+        "Dropped 7 log lines exceeding the rate limit of 3 lines per second",
+    ]
+    assert records[-1].levelno == logging.WARNING
+
+
+def test_followed_stream_closed_on_stop(caplog: pytest.LogCaptureFixture) -> None:
+    container = FakeContainer(FakeLogStream([b"line 1\n"], follow=True))
+    forwarder = ContainerLogForwarder(container, logging.getLogger(LOGGER_NAME))  # type: ignore[arg-type]
+
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        forwarder.start()
+        forwarder.stop(timeout=0.1)
+
+    assert container.logs_kwargs == {"stream": True, "follow": True, "since": None}
+    assert [record.getMessage() for record in caplog.records if record.name == LOGGER_NAME] == ["line 1"]
+
+
+def test_log_lines_appended_to_buffer(caplog: pytest.LogCaptureFixture) -> None:
+    buffer = ContainerLogBuffer()
+
+    forward_logs([f"line {i}\n".encode() for i in range(3)], caplog, buffer=buffer, max_lines_per_second=1)
+
+    assert buffer.lines() == ["line 0", "line 1", "line 2"]
+
+
+def test_log_lines_only_appended_to_buffer_without_logger() -> None:
+    buffer = ContainerLogBuffer()
+    forwarder = ContainerLogForwarder(
+        FakeContainer(FakeLogStream([b"line 1\n", b"line 2\n"])),  # type: ignore[arg-type]
+        logger=None,
+        buffer=buffer,
+    )
+
+    forwarder.start()
+    forwarder.stop(timeout=None)
+
+    assert buffer.lines() == ["line 1", "line 2"]
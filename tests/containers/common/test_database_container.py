@@ -1,7 +1,7 @@
 import pytest
 from sqlalchemy.exc import OperationalError
 
-from tomodachi_testcontainers import MySQLContainer
+from tomodachi_testcontainers import DatabaseContainer, MySQLContainer
 from tomodachi_testcontainers.containers.common.database import DatabaseURL, wait_for_database_healthcheck
 from tomodachi_testcontainers.utils import get_available_port
 
@@ -21,3 +21,16 @@ def test_no_connection_to_host() -> None:
 
 def test_healthcheck_passes(mysql_container: MySQLContainer) -> None:
     wait_for_database_healthcheck(mysql_container.get_external_url(), timeout=1.0)
+
+
+class CustomDatabaseContainer(DatabaseContainer):
+    def log_message_on_container_start(self) -> str:
+        return "Custom database started"
+
+
+def test_separate_database_not_supported_without_create_database() -> None:
+    container = CustomDatabaseContainer("postgres:16", internal_port=5432)
+
+    with pytest.raises(NotImplementedError, match="CustomDatabaseContainer doesn't support separate databases"):
+        with container.separate_database("test"):
+            pass
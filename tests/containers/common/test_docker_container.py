@@ -1,4 +1,7 @@
+import asyncio
 import atexit
+import time
+from unittest.mock import patch
 
 import docker
 import docker.errors
@@ -10,8 +13,8 @@ from tomodachi_testcontainers.containers.common.container import ContainerWithSa
 
 
 class WorkingContainer(DockerContainer):
-    def __init__(self, disable_logging: bool = False) -> None:
-        super().__init__(image="alpine:latest", disable_logging=disable_logging)
+    def __init__(self, disable_logging: bool = False, reuse: bool = False) -> None:
+        super().__init__(image="alpine:latest", disable_logging=disable_logging, reuse=reuse)
         self.with_command("sleep infinity")
 
     def log_message_on_container_start(self) -> str:
@@ -106,6 +109,109 @@ class TestContainerStartupAndCleanup:
         assert output == b"true\n"
 
 
+class TestAsyncContainerLifecycle:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_container_started_and_removed_with_async_context_manager(self) -> None:
+        container_name = shortuuid.uuid()
+
+        async with WorkingContainer().with_name(container_name):
+            assert docker.from_env().containers.get(container_name)
+
+        with pytest.raises(docker.errors.NotFound):
+            docker.from_env().containers.get(container_name)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_containers_started_concurrently(self) -> None:
+        containers = [WorkingContainer().with_name(shortuuid.uuid()) for _ in range(3)]
+
+        await asyncio.gather(*(container.astart() for container in containers))
+        for container in containers:
+            assert docker.from_env().containers.get(container.get_wrapped_container().id).status == "running"
+
+        await asyncio.gather(*(container.astop() for container in containers))
+        for container in containers:
+            with pytest.raises(docker.errors.NotFound):
+                docker.from_env().containers.get(container._name)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_container_removed_on_failed_async_startup(self) -> None:
+        container_name = shortuuid.uuid()
+
+        with pytest.raises(RuntimeError, match="Container healthcheck failed"):
+            async with FailingHealthcheckContainer().with_name(container_name):
+                pass  # pragma: no cover
+
+        with pytest.raises(docker.errors.NotFound):
+            docker.from_env().containers.get(container_name)
+
+
+class TestDockerInspectCache:
+    def test_inspect_snapshot_is_cached(self) -> None:
+        with WorkingContainer() as container:
+            docker_client = container.get_docker_client()
+            inspect = container.docker_inspect()
+
+            with patch.object(docker_client, "get_container", wraps=docker_client.get_container) as get_container:
+                assert container.docker_inspect() is inspect
+                assert container.get_container_internal_ip()
+                assert container.get_container_gateway_ip()
+
+            get_container.assert_not_called()
+
+    def test_refresh_inspect_replaces_cached_snapshot(self) -> None:
+        with WorkingContainer() as container:
+            inspect = container.docker_inspect()
+
+            refreshed_inspect = container.refresh_inspect()
+
+            assert refreshed_inspect is not inspect
+            assert container.docker_inspect() is refreshed_inspect
+            assert refreshed_inspect["Id"] == inspect["Id"]
+
+    def test_inspect_snapshot_invalidated_on_restart(self) -> None:
+        with WorkingContainer() as container:
+            inspect = container.docker_inspect()
+
+            container.restart()
+
+            assert container.docker_inspect() is not inspect
+            assert container.docker_inspect()["State"]["StartedAt"] != inspect["State"]["StartedAt"]
+
+
+class TestContainerReuse:
+    def test_reusable_container_is_not_removed_on_context_manager_exit(self) -> None:
+        container_name = shortuuid.uuid()
+        with WorkingContainer(reuse=True).with_name(container_name) as container:
+            pass
+        atexit.register(container.stop)
+
+        assert docker.from_env().containers.get(container_name).status == "running"
+
+    def test_running_container_with_same_configuration_is_reused(self) -> None:
+        env_value = shortuuid.uuid()
+        with WorkingContainer(reuse=True).with_env("REUSE_TEST", env_value) as first_container:
+            pass
+        atexit.register(first_container.stop)
+
+        with WorkingContainer(reuse=True).with_env("REUSE_TEST", env_value) as second_container:
+            assert second_container.get_wrapped_container().id == first_container.get_wrapped_container().id
+
+    def test_container_with_different_configuration_is_not_reused(self) -> None:
+        with WorkingContainer(reuse=True).with_env("REUSE_TEST", shortuuid.uuid()) as first_container:
+            pass
+        atexit.register(first_container.stop)
+
+        with WorkingContainer(reuse=True).with_env("REUSE_TEST", shortuuid.uuid()) as second_container:
+            atexit.register(second_container.stop)
+            assert second_container.get_wrapped_container().id != first_container.get_wrapped_container().id
+
+    def test_reuse_hash_does_not_depend_on_host_ports(self) -> None:
+        first_container = WorkingContainer().with_bind_ports(80, 8080)
+        second_container = WorkingContainer().with_bind_ports(80, 8081)
+
+        assert first_container.get_reuse_hash() == second_container.get_reuse_hash()
+
+
 class TestLogging:
     def test_container_logs_are_forwarded_on_context_manager_exit(self, capsys: pytest.CaptureFixture) -> None:
         with WorkingContainer() as container:
@@ -123,6 +229,18 @@ class TestLogging:
         assert "--- Logging error ---" not in stderr
         assert "container healthcheck failed" in stderr
 
+    def test_container_logs_are_forwarded_while_container_is_running(self, capsys: pytest.CaptureFixture) -> None:
+        with WorkingContainer() as container:
+            container.exec("sh -c 'echo \"my log message\" >> /proc/1/fd/1'")
+
+            stderr = ""
+            deadline = time.monotonic() + 5
+            while "my log message" not in stderr and time.monotonic() < deadline:
+                time.sleep(0.1)
+                stderr += str(capsys.readouterr().err)
+
+            assert "my log message" in stderr
+
     def test_container_logs_are_not_forwarded_outside_of_context_manager(self, capsys: pytest.CaptureFixture) -> None:
         container = WorkingContainer().start()
         atexit.register(container.stop)
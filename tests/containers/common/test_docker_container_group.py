@@ -0,0 +1,79 @@
+import time
+
+import docker
+import docker.errors
+import pytest
+import shortuuid
+
+from tomodachi_testcontainers import DockerContainer, DockerContainerGroup
+
+
+class SlowStartingContainer(DockerContainer):
+    def __init__(self, startup_delay: float = 1.0) -> None:
+        super().__init__(image="alpine:latest")
+        self.with_command("sleep infinity")
+        self._startup_delay = startup_delay
+
+    def log_message_on_container_start(self) -> str:
+        return "Slow starting container started"
+
+    def start(self) -> "SlowStartingContainer":
+        super().start()
+        time.sleep(self._startup_delay)
+        return self
+
+
+class FailingHealthcheckContainer(DockerContainer):
+    def __init__(self) -> None:
+        super().__init__(image="alpine:latest")
+        self.with_command("sleep infinity")
+
+    def log_message_on_container_start(self) -> str:
+        return "Container with a broken healthcheck started"
+
+    def start(self) -> "FailingHealthcheckContainer":
+        super().start()
+        raise RuntimeError("Container healthcheck failed")
+
+
+def test_containers_started_concurrently() -> None:
+    started_at = time.monotonic()
+
+    with DockerContainerGroup(
+        SlowStartingContainer(startup_delay=2.0),
+        SlowStartingContainer(startup_delay=2.0),
+        SlowStartingContainer(startup_delay=2.0),
+    ) as containers:
+        elapsed = time.monotonic() - started_at
+        assert len(containers) == 3
+
+    assert elapsed < 6.0
+
+
+def test_containers_removed_on_context_manager_exit() -> None:
+    container_names = [shortuuid.uuid(), shortuuid.uuid()]
+
+    with DockerContainerGroup(*(SlowStartingContainer(startup_delay=0).with_name(name) for name in container_names)):
+        pass
+
+    for container_name in container_names:
+        with pytest.raises(docker.errors.NotFound):
+            docker.from_env().containers.get(container_name)
+
+
+def test_started_containers_removed_when_other_container_fails_to_start() -> None:
+    working_container_name = shortuuid.uuid()
+    failing_container_name = shortuuid.uuid()
+
+    with (
+        pytest.raises(RuntimeError, match="Container healthcheck failed"),
+        DockerContainerGroup(
+            SlowStartingContainer(startup_delay=0).with_name(working_container_name),
+            FailingHealthcheckContainer().with_name(failing_container_name),
+        ),
+    ):
+        pass  # pragma: no cover
+
+    for container_name in (working_container_name, failing_container_name):
+        with pytest.raises(docker.errors.NotFound):
+            docker.from_env().containers.get(container_name)
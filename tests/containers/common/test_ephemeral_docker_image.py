@@ -133,3 +133,60 @@ def test_build_error_when_dockerfile_is_invalid__without_buildkit(
 
     with pytest.raises(BuildError), EphemeralDockerImage(Path(dockerfile_invalid)):
         pass
+
+
+@pytest.fixture
+def build_context(tmp_path: Path) -> Path:
+    (tmp_path / "Dockerfile").write_text("FROM alpine:latest\nCOPY file.txt /file.txt\n", encoding="utf-8")
+    (tmp_path / "file.txt").write_text("file", encoding="utf-8")
+    (tmp_path / ".dockerignore").write_text("ignored.txt\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_cached_image_is_not_rebuilt_and_not_removed_on_cleanup(build_context: Path) -> None:
+    with EphemeralDockerImage(context=build_context, cache=True) as first_image:
+        pass
+    with EphemeralDockerImage(context=build_context, cache=True) as second_image:
+        pass
+
+    assert first_image.id == second_image.id
+    assert get_docker_image(image_id=str(first_image.id))
+
+
+def test_previously_cached_image_removed_when_build_context_changes(build_context: Path) -> None:
+    with EphemeralDockerImage(context=build_context, cache=True) as first_image:
+        pass
+    (build_context / "file.txt").write_text("changed file", encoding="utf-8")
+    with EphemeralDockerImage(context=build_context, cache=True) as second_image:
+        pass
+
+    assert get_docker_image(image_id=str(second_image.id))
+    with pytest.raises(ImageNotFound):
+        get_docker_image(image_id=str(first_image.id))
+
+
+def test_cache_invalidated_when_build_context_changes(build_context: Path) -> None:
+    first_hash = EphemeralDockerImage(context=build_context, cache=True).get_content_hash()
+    (build_context / "file.txt").write_text("changed file", encoding="utf-8")
+    second_hash = EphemeralDockerImage(context=build_context, cache=True).get_content_hash()
+
+    assert first_hash != second_hash
+
+
+def test_cache_invalidated_when_build_target_changes(dockerfile_multi_stage: Path) -> None:
+    development_hash = EphemeralDockerImage(
+        dockerfile_multi_stage, context=dockerfile_multi_stage.parent, target="development", cache=True
+    ).get_content_hash()
+    release_hash = EphemeralDockerImage(
+        dockerfile_multi_stage, context=dockerfile_multi_stage.parent, target="release", cache=True
+    ).get_content_hash()
+
+    assert development_hash != release_hash
+
+
+def test_dockerignored_files_do_not_invalidate_cache(build_context: Path) -> None:
+    first_hash = EphemeralDockerImage(context=build_context, cache=True).get_content_hash()
+    (build_context / "ignored.txt").write_text("ignored file", encoding="utf-8")
+    second_hash = EphemeralDockerImage(context=build_context, cache=True).get_content_hash()
+
+    assert first_hash == second_hash
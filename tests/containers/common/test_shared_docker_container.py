@@ -0,0 +1,81 @@
+import json
+import subprocess  # nosec: B404
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+import docker
+import docker.errors
+import pytest
+
+from tomodachi_testcontainers import DockerContainer, SharedDockerContainer
+from tomodachi_testcontainers.containers.common.container import get_running_containers
+
+
+class WorkingContainer(DockerContainer):
+    def __init__(self) -> None:
+        super().__init__(image="alpine:latest")
+        self.with_command("sleep infinity")
+
+    def log_message_on_container_start(self) -> str:
+        return "Working container started"
+
+
+def test_second_worker_attaches_to_started_container(tmp_path: Path) -> None:
+    with SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test") as first_container:
+        with SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test") as second_container:
+            assert second_container.get_wrapped_container().id == first_container.get_wrapped_container().id
+
+
+def test_container_removed_when_last_worker_exits(tmp_path: Path) -> None:
+    first_worker = ExitStack()
+    second_worker = ExitStack()
+
+    container = first_worker.enter_context(SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test"))
+    second_worker.enter_context(SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test"))
+    container_id = container.get_wrapped_container().id
+
+    first_worker.close()
+    assert docker.from_env().containers.get(container_id).status == "running"
+
+    second_worker.close()
+    with pytest.raises(docker.errors.NotFound):
+        docker.from_env().containers.get(container_id)
+
+
+def test_log_forwarder_stopped_when_worker_exits(tmp_path: Path) -> None:
+    with SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test"):
+        with SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test") as second_container:
+            assert second_container in get_running_containers()
+
+        assert second_container not in get_running_containers()
+        assert second_container._log_forwarder is None
+
+
+def test_new_container_started_when_shared_container_no_longer_exists(tmp_path: Path) -> None:
+    with SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test") as first_container:
+        container_id = first_container.get_wrapped_container().id
+        first_container.stop()
+
+        with SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test") as second_container:
+            assert second_container.get_wrapped_container().id != container_id
+
+
+def test_attached_worker_forwards_container_logs(tmp_path: Path) -> None:
+    with SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test"):
+        with SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test") as second_container:
+            assert second_container._log_forwarding_enabled
+
+
+def test_container_removed_when_other_worker_crashed(tmp_path: Path) -> None:
+    crashed_worker = subprocess.Popen([sys.executable, "-c", "pass"])  # nosec: B603
+    crashed_worker.wait()
+
+    with SharedDockerContainer(WorkingContainer(), state_dir=tmp_path, key="test") as container:
+        state_file = tmp_path / "tomodachi-testcontainers-test.json"
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+        state_file.write_text(json.dumps({**state, "pids": [*state["pids"], crashed_worker.pid]}), encoding="utf-8")
+        container_id = container.get_wrapped_container().id
+
+    with pytest.raises(docker.errors.NotFound):
+        docker.from_env().containers.get(container_id)
@@ -0,0 +1,71 @@
+import threading
+from collections.abc import Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from tomodachi_testcontainers import DockerContainer
+from tomodachi_testcontainers.containers.common.wait_strategies import StreamingLogMessageWaitStrategy
+
+
+class FakeLogStream:
+    def __init__(self, chunks: list[bytes], *, follow: bool = False) -> None:
+        self._chunks = chunks
+        self._follow = follow
+        self._closed = threading.Event()
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._chunks
+        if self._follow:
+            self._closed.wait()
+            raise ConnectionError("Stream closed")
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+def container_with_logs(stream: FakeLogStream) -> Mock:
+    container = Mock(spec_set=DockerContainer)
+    container.get_wrapped_container.return_value.logs.return_value = stream
+    return container
+
+
+def test_message_found() -> None:
+    container = container_with_logs(FakeLogStream([b"starting\n", b"Ready.\n"], follow=True))
+
+    StreamingLogMessageWaitStrategy(r"Ready\.\n").with_startup_timeout(1).wait_until_ready(container)
+
+    container.get_wrapped_container.return_value.logs.assert_called_once_with(stream=True, follow=True)
+
+
+def test_message_split_between_chunks() -> None:
+    container = container_with_logs(FakeLogStream([b"Rea", b"dy", b".\n"], follow=True))
+
+    StreamingLogMessageWaitStrategy(r"Ready\.\n").with_startup_timeout(1).wait_until_ready(container)
+
+
+def test_message_without_trailing_newline() -> None:
+    container = container_with_logs(FakeLogStream([b"listening on port:", b" 8080"], follow=True))
+
+    StreamingLogMessageWaitStrategy("port:").with_startup_timeout(1).wait_until_ready(container)
+
+
+def test_multibyte_character_split_between_chunks() -> None:
+    message = "Sveiki, pasaulē!\n".encode()
+    container = container_with_logs(FakeLogStream([message[:15], message[15:]], follow=True))
+
+    StreamingLogMessageWaitStrategy("pasaulē").with_startup_timeout(1).wait_until_ready(container)
+
+
+def test_timeout_reached() -> None:
+    container = container_with_logs(FakeLogStream([b"starting\n"], follow=True))
+
+    with pytest.raises(TimeoutError, match="Container did not emit logs containing 'Ready'"):
+        StreamingLogMessageWaitStrategy("Ready").with_startup_timeout(1).wait_until_ready(container)
+
+
+def test_container_exited_before_message_found() -> None:
+    container = container_with_logs(FakeLogStream([b"starting\n", b"exiting\n"]))
+
+    with pytest.raises(RuntimeError, match="Container exited before emitting logs containing 'Ready'"):
+        StreamingLogMessageWaitStrategy("Ready").with_startup_timeout(1).wait_until_ready(container)
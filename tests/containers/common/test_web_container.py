@@ -9,8 +9,8 @@ from tomodachi_testcontainers.utils import get_available_port
 
 
 class HTTPBinContainer(WebContainer):
-    def __init__(self) -> None:
-        super().__init__(image="kennethreitz/httpbin", internal_port=80)
+    def __init__(self, edge_port: int | None = None) -> None:
+        super().__init__(image="kennethreitz/httpbin", internal_port=80, edge_port=edge_port)
 
     def log_message_on_container_start(self) -> str:
         return f"HTTPBin container: http://localhost:{self.edge_port}"
@@ -22,6 +22,21 @@ def httpbin_container() -> Generator[DockerContainer, None, None]:
         yield container
 
 
+def test_edge_port_assigned_by_docker(httpbin_container: HTTPBinContainer) -> None:
+    port_bindings = httpbin_container.refresh_inspect()["NetworkSettings"]["Ports"]["80/tcp"]
+
+    assert httpbin_container.edge_port in {int(binding["HostPort"]) for binding in port_bindings}
+    assert httpbin_container.get_external_url().endswith(f":{httpbin_container.edge_port}")
+
+
+def test_explicit_edge_port_is_bound() -> None:
+    edge_port = get_available_port()
+
+    with HTTPBinContainer(edge_port=edge_port) as container:
+        assert container.edge_port == edge_port
+        wait_for_http_healthcheck(f"http://localhost:{edge_port}/status/200")
+
+
 def test_no_connection_to_host() -> None:
     with pytest.raises(ConnectionError):
         wait_for_http_healthcheck(f"http://localhost:{get_available_port()}/foo", timeout=1.0, start_period=1.0)
@@ -34,3 +49,13 @@ def test_healthcheck_returns_http_500(httpbin_container: HTTPBinContainer) -> No
 
 def test_healthcheck_returns_http_200(httpbin_container: HTTPBinContainer) -> None:
     wait_for_http_healthcheck(f"{httpbin_container.get_external_url()}/status/200")
+
+
+def test_edge_port_updated_after_restart() -> None:
+    with HTTPBinContainer() as container:
+        container.restart()
+
+        port_bindings = container.refresh_inspect()["NetworkSettings"]["Ports"]["80/tcp"]
+        assert container.edge_port in {int(binding["HostPort"]) for binding in port_bindings}
+        assert list(container.ports.values()) == [None]
+        wait_for_http_healthcheck(f"{container.get_external_url()}/status/200")
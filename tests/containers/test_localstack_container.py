@@ -26,3 +26,11 @@ async def test_create_aws_resources_andrestart_localstack_container(
 
     list_topics_response = await localstack_sns_client.list_topics()
     assert list_topics_response["Topics"] == []
+
+
+def test_edge_port_kept_after_restart(localstack_container: LocalStackContainer) -> None:
+    edge_port = localstack_container.edge_port
+
+    localstack_container.restart()
+
+    assert localstack_container.edge_port == edge_port
@@ -1,3 +1,4 @@
+import pytest
 import sqlalchemy
 
 from tomodachi_testcontainers import MySQLContainer
@@ -11,3 +12,59 @@ def test_mysql_container_starts(mysql_container: MySQLContainer) -> None:
         result = conn.execute(sqlalchemy.text("SELECT 1"))
 
     assert result.scalar() == 1
+
+
+def test_mysql_database_restored_from_snapshot(mysql_container: MySQLContainer) -> None:
+    engine = sqlalchemy.create_engine(str(mysql_container.get_external_url()))
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("CREATE TABLE snapshot_test (id INT PRIMARY KEY)"))
+        conn.execute(sqlalchemy.text("INSERT INTO snapshot_test (id) VALUES (1)"))
+    engine.dispose()
+
+    mysql_container.snapshot(name="restore_test")
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("INSERT INTO snapshot_test (id) VALUES (2)"))
+    engine.dispose()
+
+    mysql_container.restore(name="restore_test")
+    with engine.connect() as conn:
+        result = conn.execute(sqlalchemy.text("SELECT id FROM snapshot_test"))
+        assert result.scalars().all() == [1]
+        conn.execute(sqlalchemy.text("DROP TABLE snapshot_test"))
+        conn.commit()
+    engine.dispose()
+
+
+def test_restore_raises_when_snapshot_does_not_exist(mysql_container: MySQLContainer) -> None:
+    with pytest.raises(ValueError, match="Snapshot 'does_not_exist' does not exist"):
+        mysql_container.restore(name="does_not_exist")
+
+
+def test_separate_mysql_database_created_on_the_same_server(mysql_container: MySQLContainer) -> None:
+    default_url = mysql_container.get_external_url()
+
+    with mysql_container.separate_database("separate_database_test"):
+        url = mysql_container.get_external_url()
+        assert url.database == "separate_database_test"
+        assert url.port == default_url.port
+
+        engine = sqlalchemy.create_engine(str(url))
+        with engine.connect() as conn:
+            result = conn.execute(sqlalchemy.text("SELECT 1"))
+            assert result.scalar() == 1
+        engine.dispose()
+
+    assert mysql_container.get_external_url() == default_url
+
+
+def test_mysql_in_memory_data_directory() -> None:
+    with MySQLContainer(in_memory=True, in_memory_size="256m") as container:
+        assert container.docker_inspect()["HostConfig"]["Tmpfs"] == {"/var/lib/mysql": "size=256m"}
+        _, output = container.exec(["sh", "-c", "df -T /var/lib/mysql | tail -n 1"])
+        assert output.decode().split()[1] == "tmpfs"
+
+        engine = sqlalchemy.create_engine(str(container.get_external_url()))
+        with engine.connect() as conn:
+            result = conn.execute(sqlalchemy.text("SELECT 1"))
+            assert result.scalar() == 1
+        engine.dispose()
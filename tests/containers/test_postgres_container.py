@@ -1,3 +1,4 @@
+import pytest
 import sqlalchemy
 
 from tomodachi_testcontainers import PostgreSQLContainer
@@ -11,3 +12,60 @@ def test_postgres_container_starts(postgres_container: PostgreSQLContainer) -> N
         result = conn.execute(sqlalchemy.text("SELECT version();"))
 
     assert "PostgreSQL" in str(result.scalar())
+
+
+def test_postgres_database_restored_from_snapshot(postgres_container: PostgreSQLContainer) -> None:
+    engine = sqlalchemy.create_engine(str(postgres_container.get_external_url()))
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("CREATE TABLE snapshot_test (id INT PRIMARY KEY)"))
+        conn.execute(sqlalchemy.text("INSERT INTO snapshot_test (id) VALUES (1)"))
+    engine.dispose()
+
+    postgres_container.snapshot(name="restore_test")
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("INSERT INTO snapshot_test (id) VALUES (2)"))
+    engine.dispose()
+
+    postgres_container.restore(name="restore_test")
+    with engine.connect() as conn:
+        result = conn.execute(sqlalchemy.text("SELECT id FROM snapshot_test"))
+        assert result.scalars().all() == [1]
+        conn.execute(sqlalchemy.text("DROP TABLE snapshot_test"))
+        conn.commit()
+    engine.dispose()
+
+
+def test_restore_raises_when_snapshot_does_not_exist(postgres_container: PostgreSQLContainer) -> None:
+    with pytest.raises(ValueError, match="Snapshot 'does_not_exist' does not exist"):
+        postgres_container.restore(name="does_not_exist")
+
+
+def test_separate_postgres_database_created_on_the_same_server(postgres_container: PostgreSQLContainer) -> None:
+    default_url = postgres_container.get_external_url()
+
+    with postgres_container.separate_database("separate_database_test"):
+        url = postgres_container.get_external_url()
+        assert url.database == "separate_database_test"
+        assert url.port == default_url.port
+
+        engine = sqlalchemy.create_engine(str(url))
+        with engine.connect() as conn:
+            result = conn.execute(sqlalchemy.text("SELECT 1"))
+            assert result.scalar() == 1
+        engine.dispose()
+
+    assert postgres_container.get_external_url() == default_url
+
+
+def test_postgres_in_memory_data_directory() -> None:
+    with PostgreSQLContainer(in_memory=True, in_memory_size="256m") as container:
+        assert container.docker_inspect()["HostConfig"]["Tmpfs"] == {"/var/lib/postgresql-tmpfs": "size=256m"}
+        _, output = container.exec(["sh", "-c", 'df -T "$PGDATA" | tail -n 1'])
+        assert output.decode().split()[1] == "tmpfs"
+        assert output.decode().split()[-1] == "/var/lib/postgresql-tmpfs"
+
+        engine = sqlalchemy.create_engine(str(container.get_external_url()))
+        with engine.connect() as conn:
+            result = conn.execute(sqlalchemy.text("SELECT 1"))
+            assert result.scalar() == 1
+        engine.dispose()
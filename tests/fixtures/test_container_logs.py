@@ -0,0 +1,53 @@
+from textwrap import dedent
+
+import pytest
+
+
+def test_container_logs_emitted_during_failed_test_attached_to_report(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        dedent(
+            """\
+            import time
+            from collections.abc import Generator
+
+            import pytest
+
+            from tomodachi_testcontainers import DockerContainer
+
+
+            class WorkingContainer(DockerContainer):
+                def __init__(self) -> None:
+                    super().__init__(image="alpine:latest")
+                    self.with_command("sleep infinity")
+
+                def log_message_on_container_start(self) -> str:
+                    return "Working container started"
+
+
+            @pytest.fixture(scope="module")
+            def container() -> Generator[WorkingContainer, None, None]:
+                with WorkingContainer() as container:
+                    yield container
+
+
+            def log(container: WorkingContainer, message: str) -> None:
+                container.exec(f"sh -c 'echo \\"{message}\\" >> /proc/1/fd/1'")
+                time.sleep(1)  # Wait for the log forwarder to read the log line
+
+
+            def test_passing(container: WorkingContainer) -> None:
+                log(container, "passing test log")
+
+
+            def test_failing(container: WorkingContainer) -> None:
+                log(container, "failing test log")
+                assert False
+            """
+        )
+    )
+
+    result = pytester.runpytest_subprocess()
+
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*Captured container logs call: WorkingContainer (*)*", "failing test log"])
+    result.stdout.no_fnmatch_line("passing test log")
@@ -26,7 +26,7 @@ def test_assert_datetime_within_range() -> None:
 
 def test_assert_logs_contain() -> None:
     mock_container = Mock(spec_set=DockerContainer)
-    mock_container.get_logs = Mock(return_value=(b"stdout\n", b"stderr\n"))
+    mock_container.get_log_cursor.return_value.lines = Mock(return_value=["stdout", "stderr"])
 
     assert_logs_contain(mock_container, "stdout")
     assert_logs_contain(mock_container, "stderr")
@@ -37,7 +37,7 @@ def test_assert_logs_contain() -> None:
 
 def test_assert_logs_not_contain() -> None:
     mock_container = Mock(spec_set=DockerContainer)
-    mock_container.get_logs = Mock(return_value=(b"stdout\n", b"stderr\n"))
+    mock_container.get_log_cursor.return_value.lines = Mock(return_value=["stdout", "stderr"])
 
     assert_logs_not_contain(mock_container, "foo")
 
@@ -49,7 +49,9 @@ def test_assert_logs_not_contain() -> None:
 
 def test_assert_logs_match_line_count() -> None:
     mock_container = Mock(spec_set=DockerContainer)
-    mock_container.get_logs = Mock(return_value=(b"stdout-1\nfoo\nstdout-2\nbar\n", b"foo\nstderr-1\nbar\nstderr-2\n"))
+    mock_container.get_log_cursor.return_value.lines = Mock(
+        return_value=["stdout-1", "foo", "stdout-2", "bar", "foo", "stderr-1", "bar", "stderr-2"]
+    )
 
     assert_logs_match_line_count(mock_container, "stdout-", count=2)
     assert_logs_match_line_count(mock_container, "stderr-", count=2)
@@ -59,3 +61,23 @@ def test_assert_logs_match_line_count() -> None:
         assert_logs_match_line_count(mock_container, "stderr-", count=1)
     with pytest.raises(AssertionError, match="Expected 'baz' to be contained in 2 lines, found 0 lines"):
         assert_logs_match_line_count(mock_container, "baz", count=2)
+
+
+def test_assert_logs_since_position() -> None:
+    mock_container = Mock(spec_set=DockerContainer)
+    mock_container.get_log_cursor.return_value.lines = Mock(return_value=["new log"])
+
+    assert_logs_contain(mock_container, "new log", since=5)
+    assert_logs_not_contain(mock_container, "old log", since=5)
+    assert_logs_match_line_count(mock_container, "new log", count=1, since=5)
+
+    mock_container.get_log_cursor.return_value.lines.assert_called_with(since=5)
+
+
+def test_assert_logs_check_whole_log_by_default() -> None:
+    mock_container = Mock(spec_set=DockerContainer)
+    mock_container.get_log_cursor.return_value.lines = Mock(return_value=["old log"])
+
+    assert_logs_contain(mock_container, "old log")
+
+    mock_container.get_log_cursor.return_value.lines.assert_called_once_with(since=0)
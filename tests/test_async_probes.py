@@ -1,6 +1,19 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from tomodachi_testcontainers.async_probes import probe_during_interval, probe_until
+from tomodachi_testcontainers.async_probes import (
+    Backoff,
+    ProbeStats,
+    ProbeTimeoutError,
+    probe_all,
+    probe_any,
+    probe_during_interval,
+    probe_until,
+)
 
 
 class TestProbeUntil:
@@ -43,6 +56,15 @@ class TestProbeUntil:
 
         assert result is True
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_with_lambda_returning_future(self) -> None:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(True)
+
+        result = await probe_until(lambda: future, probe_interval=0.1, stop_after=0.3)
+
+        assert result is True
+
     @pytest.mark.asyncio(loop_scope="session")
     async def test_recovers_after_failure(self) -> None:
         attempts = [False, False, True]
@@ -62,6 +84,94 @@ class TestProbeUntil:
         with pytest.raises(AssertionError, match="assert False"):
             await probe_until(_f, probe_interval=0.1, stop_after=0.3)
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_collects_stats(self) -> None:
+        attempts = [False, False, True]
+
+        def _f() -> None:
+            assert attempts.pop(0)
+
+        stats = ProbeStats()
+        await probe_until(_f, probe_interval=0.1, stop_after=0.5, stats=stats)
+
+        assert stats.attempts == 3
+        assert 0.2 <= stats.elapsed < 0.5
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_collects_stats_on_failure(self) -> None:
+        def _f() -> None:
+            raise ValueError("Something went wrong")
+
+        stats = ProbeStats()
+        with pytest.raises(ValueError, match="Something went wrong"):
+            await probe_until(_f, probe_interval=0.1, stop_after=0.25, stats=stats)
+
+        assert stats.attempts == 4  # The last attempt starts after the deadline: 0.0, 0.1, 0.2, 0.3
+        assert stats.elapsed >= 0.25
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize(("backoff", "expected_attempts"), [("exponential", 5), ("fibonacci", 6)])
+    async def test_backoff(self, backoff: Backoff, expected_attempts: int) -> None:
+        def _f() -> None:
+            raise ValueError("Something went wrong")
+
+        stats = ProbeStats()
+        with pytest.raises(ValueError, match="Something went wrong"):
+            # Exponential attempts at: 0.0, 0.05, 0.15, 0.35, 0.75; Fibonacci: 0.0, 0.05, 0.1, 0.2, 0.35, 0.6
+            await probe_until(
+                _f, probe_interval=0.05, stop_after=0.5, backoff=backoff, max_probe_interval=10.0, stats=stats
+            )
+
+        assert stats.attempts == expected_attempts
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_backoff_interval_capped(self) -> None:
+        def _f() -> None:
+            raise ValueError("Something went wrong")
+
+        stats = ProbeStats()
+        with pytest.raises(ValueError, match="Something went wrong"):
+            await probe_until(
+                _f, probe_interval=0.05, stop_after=1.0, backoff="exponential", max_probe_interval=0.1, stats=stats
+            )
+
+        assert stats.attempts >= 10
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("backoff", ["exponential", "fibonacci"])
+    async def test_backoff_interval_does_not_overflow_after_many_attempts(self, backoff: Backoff) -> None:
+        attempts = 0
+
+        async def _f() -> int:
+            nonlocal attempts
+            attempts += 1
+            if attempts < 1100:
+                raise ValueError("Something went wrong")
+            return attempts
+
+        result = await probe_until(_f, probe_interval=1e-9, stop_after=10.0, backoff=backoff, max_probe_interval=1e-4)
+
+        assert result == 1100
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_wakes_on_event(self) -> None:
+        event = asyncio.Event()
+        attempts = [False, True]
+
+        def _f() -> None:
+            assert attempts.pop(0)
+
+        async def _wake_later() -> None:
+            await asyncio.sleep(0.1)
+            event.set()
+
+        wake_task = asyncio.create_task(_wake_later())
+        started_at = time.monotonic()
+        await probe_until(_f, probe_interval=5.0, stop_after=10.0, wake_on=event)
+        await wake_task
+
+        assert time.monotonic() - started_at < 1.0
+
 
 class TestProbeDuringInterval:
     @pytest.mark.asyncio(loop_scope="session")
@@ -122,3 +232,143 @@ class TestProbeDuringInterval:
 
         with pytest.raises(ValueError, match="Something went wrong"):
             await probe_during_interval(_f, probe_interval=0.1, stop_after=0.5)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_collects_stats(self) -> None:
+        stats = ProbeStats()
+        await probe_during_interval(lambda: True, probe_interval=0.1, stop_after=0.25, stats=stats)
+
+        assert stats.attempts == 4
+        assert stats.elapsed >= 0.25
+
+
+class TestProbeAll:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_returns_results_of_all_probes(self) -> None:
+        attempts = [False, True]
+
+        def _sync_probe() -> str:
+            assert attempts.pop(0)
+            return "sync"
+
+        async def _async_probe() -> str:
+            return "async"
+
+        results = await probe_all(_sync_probe, _async_probe, probe_interval=0.1, stop_after=1.0)
+
+        assert results == ["sync", "async"]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_probes_share_deadline(self) -> None:
+        async def _slow_probe() -> None:
+            await asyncio.sleep(0.3)
+
+        started_at = time.monotonic()
+        await probe_all(_slow_probe, _slow_probe, _slow_probe, stop_after=1.0)
+
+        assert time.monotonic() - started_at < 0.6
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_sync_probes_do_not_block_event_loop(self) -> None:
+        def _blocking_probe() -> None:
+            time.sleep(0.3)
+
+        started_at = time.monotonic()
+        await probe_all(_blocking_probe, _blocking_probe, stop_after=1.0)
+
+        assert time.monotonic() - started_at < 0.6
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_timeout_reports_failed_probes(self) -> None:
+        def _passing_probe() -> None:
+            pass
+
+        def _failing_probe() -> None:
+            raise ValueError("Something went wrong")
+
+        with pytest.raises(ProbeTimeoutError, match="1 probe\\(s\\) did not succeed within 0.3 seconds") as exc_info:
+            await probe_all(_passing_probe, _failing_probe, probe_interval=0.1, stop_after=0.3)
+
+        [(probe_name, error)] = exc_info.value.errors.items()
+        assert probe_name == "#1 _failing_probe"
+        assert isinstance(error, ValueError)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rate_limit_shared_between_probes(self) -> None:
+        attempts = 0
+
+        def _failing_probe() -> None:
+            nonlocal attempts
+            attempts += 1
+            raise ValueError("Something went wrong")
+
+        with pytest.raises(ProbeTimeoutError):
+            await probe_all(_failing_probe, _failing_probe, probe_interval=0.01, stop_after=0.5, rate_limit=10)
+
+        assert attempts <= 6
+
+
+class TestProbeAny:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_returns_result_of_first_successful_probe(self) -> None:
+        async def _slow_probe() -> str:
+            await asyncio.sleep(1.0)
+            return "slow"
+
+        async def _fast_probe() -> str:
+            return "fast"
+
+        result = await probe_any(_slow_probe, _fast_probe, stop_after=2.0)
+
+        assert result == "fast"
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_timeout_reports_all_failed_probes(self) -> None:
+        def _failing_probe() -> None:
+            raise ValueError("Something went wrong")
+
+        with pytest.raises(ProbeTimeoutError, match="2 probe\\(s\\) did not succeed within 0.3 seconds") as exc_info:
+            await probe_any(_failing_probe, _failing_probe, probe_interval=0.1, stop_after=0.3)
+
+        assert list(exc_info.value.errors) == ["#0 _failing_probe", "#1 _failing_probe"]
+
+
+class TestSynchronousProbesOffloading:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_sync_probe_does_not_block_event_loop(self) -> None:
+        def _blocking_probe() -> None:
+            time.sleep(0.3)
+
+        ticks = 0
+
+        async def _tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        tick_task = asyncio.create_task(_tick())
+        await probe_until(_blocking_probe, stop_after=1.0)
+        tick_task.cancel()
+
+        assert ticks > 10
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_sync_probe_runs_in_given_executor(self) -> None:
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="probe-executor") as executor:
+            thread_name = await probe_until(lambda: threading.current_thread().name, executor=executor)
+            during_interval_thread_name = await probe_during_interval(
+                lambda: threading.current_thread().name, stop_after=0.1, executor=executor
+            )
+
+        assert thread_name.startswith("probe-executor")
+        assert during_interval_thread_name.startswith("probe-executor")
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_async_probe_runs_in_event_loop_thread(self) -> None:
+        async def _probe() -> str:
+            return threading.current_thread().name
+
+        thread_name = await probe_until(_probe)
+
+        assert thread_name == threading.current_thread().name
@@ -62,3 +62,24 @@ def test_copy_folder_to_container(alpine_container: AlpineContainer) -> None:
     code, output = alpine_container.exec("cat /tmp/dir-2/nested/file-2.txt")
     assert code == 0
     assert bytes(output).decode("utf-8") == "file 2\n"
+
+
+def test_copy_folder_to_container_compressed(alpine_container: AlpineContainer) -> None:
+    host_path = Path(__file__).parent / "test-files"
+    alpine_container.exec("mkdir -p /tmp/dir-3")
+    container_path = Path("/tmp/dir-3")
+
+    copy_files_to_container(
+        alpine_container.get_wrapped_container(), host_path=host_path, container_path=container_path, compress=True
+    )
+
+    code, output = alpine_container.exec("find /tmp/dir-3 -type f")
+    assert code == 0
+    assert set(bytes(output).decode("utf-8").strip().split("\n")) == {
+        "/tmp/dir-3/nested/file-2.txt",
+        "/tmp/dir-3/file-1.txt",
+    }
+
+    code, output = alpine_container.exec("cat /tmp/dir-3/nested/file-2.txt")
+    assert code == 0
+    assert bytes(output).decode("utf-8") == "file 2\n"